@@ -1,77 +1,196 @@
 // --- Configuration and API Setup ---
-// In a real production environment, you would use environment variables for this.
-// For Vercel deployment, the backend will be hosted at the same domain under /api.
-const API_BASE_URL = window.location.origin.includes('localhost')
-  ? 'http://localhost:3001/api' // Development URL for backend
-  : '/api'; // Production relative path
+// Substituted by Vite at build time. .env.development points at the local
+// backend; production builds leave it unset and use the same-origin /api path.
+const API_BASE_URL = import.meta.env.VITE_API_BASE_URL || '/api';
+
+// Persisted settings are read once at module load and handed to the providers
+const hasStorage = typeof localStorage !== 'undefined';
+const BOOT_THEME = hasStorage ? localStorage.getItem('theme') : null;
+const BOOT_TOKEN = hasStorage ? localStorage.getItem('token') : null;
+
+// One axios instance shared by auth and data calls.
+// The current token lives outside React so the request interceptor can read it.
+const currentToken = { value: BOOT_TOKEN };
+const apiClient = axios.create({ baseURL: API_BASE_URL });
+
+apiClient.interceptors.request.use(config => {
+  if (currentToken.value) {
+    config.headers.Authorization = `Bearer ${currentToken.value}`;
+  }
+  return config;
+});
+
+// Identical GETs already in flight share one promise. Requests with their
+// own config (e.g. an abort signal) are never shared.
+const inflightGets = new Map();
+const sendGet = apiClient.get.bind(apiClient);
+apiClient.get = (url, config) => {
+  if (config) return sendGet(url, config);
+  const key = `${currentToken.value}|${url}`;
+  let pending = inflightGets.get(key);
+  if (!pending) {
+    pending = sendGet(url).finally(() => inflightGets.delete(key));
+    inflightGets.set(key, pending);
+  }
+  return pending;
+};
 
 // --- Utility Functions and Hooks ---
 
 // 1. Auth Context
-const AuthContext = createContext();
+// State and actions live in separate contexts: the actions object never
+// changes identity, so consumers that only need e.g. logout skip auth churn.
+const AuthStateContext = createContext();
+const AuthActionsContext = createContext();
+
+// Verified user payloads are cached per token so a page refresh
+// doesn't block on a /verify round-trip.
+const VERIFY_TTL_MS = 15 * 60_000;
+const verifyCacheKey = (token) => `verify:${token.slice(-16)}`;
+
+const readVerifiedUser = (token) => {
+  try {
+    const cached = JSON.parse(localStorage.getItem(verifyCacheKey(token)));
+    return cached && cached.exp > Date.now() ? cached.user : null;
+  } catch {
+    return null;
+  }
+};
+
+const cacheVerifiedUser = (token, user) => {
+  localStorage.setItem(verifyCacheKey(token), JSON.stringify({ user, exp: Date.now() + VERIFY_TTL_MS }));
+};
 
-const useAuth = () => useContext(AuthContext);
+const useAuthState = () => useContext(AuthStateContext);
+const useAuthActions = () => useContext(AuthActionsContext);
 
 const AuthProvider = ({ children }) => {
   const [user, setUser] = useState(null);
-  const [token, setToken] = useState(localStorage.getItem('token') || null);
+  const [token, setToken] = useState(BOOT_TOKEN);
   const [loading, setLoading] = useState(true);
 
-  const authApi = useMemo(() => axios.create({ baseURL: API_BASE_URL }), []);
-
   useEffect(() => {
-    if (token) {
-      // Mock validation on initial load
-      authApi.defaults.headers.common['Authorization'] = `Bearer ${token}`;
-      // In a real app, call a /api/verify endpoint to get user data
-      setUser({
-        id: 'user-123',
-        email: 'mock@user.com',
-        name: 'Alex Johnson',
-        subscription: 'Premium',
-        referralPoints: 120,
-      });
+    if (!token) {
+      setLoading(false);
+      return;
+    }
+
+    // Rehydrate synchronously from a recent verification if we have one
+    const cached = readVerifiedUser(token);
+    if (cached) {
+      setUser(cached);
+      setLoading(false);
+      return;
     }
-    setLoading(false);
-  }, [token, authApi]);
+
+    let cancelled = false;
+    const verify = async () => {
+      try {
+        const res = await apiClient.get('/verify');
+        if (cancelled) return;
+        cacheVerifiedUser(token, res.data.user);
+        setUser(res.data.user);
+      } catch (error) {
+        // A 401 here is handled by the response interceptor below
+        console.error('Token verification failed:', error);
+      } finally {
+        if (!cancelled) setLoading(false);
+      }
+    };
+    verify();
+    return () => { cancelled = true; };
+  }, [token]);
 
   const login = useCallback(async (email, password) => {
     try {
-      const response = await authApi.post('/login', { email, password });
+      const response = await apiClient.post('/login', { email, password });
       const { token, user } = response.data;
+      cacheVerifiedUser(token, user);
       localStorage.setItem('token', token);
+      currentToken.value = token;
       setToken(token);
       setUser(user);
-      authApi.defaults.headers.common['Authorization'] = `Bearer ${token}`;
       return { success: true };
     } catch (error) {
       console.error('Login error:', error);
       return { success: false, message: error.response?.data?.message || 'Login failed' };
     }
-  }, [authApi]);
+  }, []);
 
   const signup = useCallback(async (name, email, password) => {
     try {
-      await authApi.post('/signup', { name, email, password });
+      await apiClient.post('/signup', { name, email, password });
       return { success: true };
     } catch (error) {
       console.error('Signup error:', error);
       return { success: false, message: error.response?.data?.message || 'Signup failed' };
     }
-  }, [authApi]);
+  }, []);
 
   const logout = useCallback(() => {
+    const storedToken = localStorage.getItem('token');
+    if (storedToken) localStorage.removeItem(verifyCacheKey(storedToken));
     localStorage.removeItem('token');
+    currentToken.value = null;
     setToken(null);
     setUser(null);
-    delete authApi.defaults.headers.common['Authorization'];
-  }, [authApi]);
+  }, []);
+
+  // Re-reads the current user after a server-side change (e.g. a plan upgrade)
+  // without reloading the app.
+  const refreshUser = useCallback(async () => {
+    const activeToken = currentToken.value;
+    if (!activeToken) return null;
+    const res = await apiClient.get('/verify');
+    cacheVerifiedUser(activeToken, res.data.user);
+    setUser(res.data.user);
+    return res.data.user;
+  }, []);
+
+  // Applies a local change to the signed-in user (e.g. points spent) and keeps
+  // the verify cache in step, so no round-trip or reload is needed. The cache
+  // write happens in the effect below once the new user is committed; the
+  // updater itself stays pure.
+  const localUserChangeRef = useRef(false);
+  const updateUser = useCallback((updater) => {
+    localUserChangeRef.current = true;
+    setUser(prev => (typeof updater === 'function' ? updater(prev) : updater));
+  }, []);
+
+  // Only local changes are written back here; rehydrating from the cache must
+  // not push its expiry out.
+  useEffect(() => {
+    if (!localUserChangeRef.current) return;
+    localUserChangeRef.current = false;
+    if (user && currentToken.value) cacheVerifiedUser(currentToken.value, user);
+  }, [user]);
+
+  // A 401 means the token expired or is invalid. logout() clears the token
+  // synchronously, so parallel failures from the same burst only log out once.
+  useEffect(() => {
+    const interceptor = apiClient.interceptors.response.use(
+      response => response,
+      error => {
+        if (error.response?.status === 401 && currentToken.value) {
+          logout();
+        }
+        return Promise.reject(error);
+      }
+    );
+    return () => apiClient.interceptors.response.eject(interceptor);
+  }, [logout]);
 
-  const value = useMemo(() => ({
-    user, token, loading, login, signup, logout
-  }), [user, token, loading, login, signup, logout]);
+  const state = useMemo(() => ({ user, token, loading }), [user, token, loading]);
+  const actions = useMemo(
+    () => ({ login, signup, logout, refreshUser, updateUser }),
+    [login, signup, logout, refreshUser, updateUser]
+  );
 
-  return <AuthContext.Provider value={value}>{children}</AuthContext.Provider>;
+  return (
+    <AuthActionsContext.Provider value={actions}>
+      <AuthStateContext.Provider value={state}>{children}</AuthStateContext.Provider>
+    </AuthActionsContext.Provider>
+  );
 };
 
 // 2. Theme Context
@@ -79,20 +198,15 @@ const ThemeContext = createContext();
 const useTheme = () => useContext(ThemeContext);
 
 const ThemeProvider = ({ children }) => {
-  const [isDark, setIsDark] = useState(() => {
-    const savedTheme = localStorage.getItem('theme');
-    return savedTheme === 'dark';
-  });
+  const [isDark, setIsDark] = useState(BOOT_THEME === 'dark');
 
   const toggleTheme = useCallback(() => {
-    setIsDark(prev => {
-      const newTheme = !prev;
-      localStorage.setItem('theme', newTheme ? 'dark' : 'light');
-      return newTheme;
-    });
+    setIsDark(prev => !prev);
   }, []);
 
+  // Apply and persist the theme after the commit; the toggle updater stays pure
   useEffect(() => {
+    localStorage.setItem('theme', isDark ? 'dark' : 'light');
     if (isDark) {
       document.documentElement.classList.add('dark');
     } else {
@@ -106,6 +220,16 @@ const ThemeProvider = ({ children }) => {
 
 
 // 3. Simple Client-Side Router
+// Compile `/forum/post/:id`-style paths into regexes once per route table.
+const compileRoutes = (routes) => routes.map(route => {
+  const keys = [];
+  const pattern = route.path.replace(/:([^/]+)/g, (_, key) => {
+    keys.push(key);
+    return '([^/]+)';
+  });
+  return { route, keys, re: new RegExp(`^${pattern}$`) };
+});
+
 const useRoutes = (routes, user, loading) => {
   const [path, setPath] = useState(window.location.pathname);
 
@@ -120,18 +244,25 @@ const useRoutes = (routes, user, loading) => {
     setPath(newPath);
   }, []);
 
+  const compiled = useMemo(() => compileRoutes(routes), [routes]);
+
   const currentRoute = useMemo(() => {
-    let route = routes.find(r => r.path === path);
-    if (!route) {
-      // Check for path parameters (e.g., /forum/post-id)
-      const pathSegments = path.split('/').filter(p => p);
-      if (pathSegments.length === 3 && pathSegments[0] === 'forum') {
-        route = routes.find(r => r.path === '/forum/:id');
-        if (route) route.params = { id: pathSegments[2] };
+    for (const { route, keys, re } of compiled) {
+      const match = re.exec(path);
+      if (!match) continue;
+      if (keys.length === 0) return route;
+      // Fresh object per match; the shared route table is never mutated
+      const params = {};
+      try {
+        keys.forEach((key, i) => { params[key] = decodeURIComponent(match[i + 1]); });
+      } catch {
+        // Malformed escape (e.g. /forum/post/%E0): treat the route as unmatched
+        continue;
       }
+      return { ...route, params };
     }
-    return route;
-  }, [path, routes]);
+    return undefined;
+  }, [path, compiled]);
 
   // Handle Authentication Redirects
   useEffect(() => {
@@ -152,38 +283,161 @@ const useRoutes = (routes, user, loading) => {
 
 
 // 4. API Client for authenticated requests
-const useApi = () => {
-  const { token, logout } = useAuth();
+// Kept as a hook so pages don't reach for the module singleton directly.
+const useApi = () => apiClient;
+
+// 5. Cached GETs
+// Responses are kept per token and URL. Within ttlMs an entry is served as-is;
+// for a further swrMs it is still served, but a background refetch replaces it
+// (stale-while-revalidate). Older entries are treated as missing.
+const CACHED_GET_TTL_MS = 5 * 60_000;
+const CACHED_GET_SWR_MS = 10 * 60_000;
+const getCache = new Map();
+const getCacheListeners = new Set();
+const pendingCachedGets = new Map();
+const failedCachedGets = new Map();
+
+const getCacheKey = (url) => `${currentToken.value}|${url}`;
+
+const subscribeGetCache = (listener) => {
+  getCacheListeners.add(listener);
+  return () => getCacheListeners.delete(listener);
+};
 
-  const api = useMemo(() => {
-    const instance = axios.create({ baseURL: API_BASE_URL });
+// One promise per key while in flight, so Suspense retries see the same thenable.
+// Failures are logged and remembered rather than rethrown.
+const revalidateGet = (instance, url) => {
+  const key = getCacheKey(url);
+  let pending = pendingCachedGets.get(key);
+  if (!pending) {
+    pending = instance.get(url)
+      .then(res => {
+        failedCachedGets.delete(key);
+        getCache.set(key, { data: res.data, fetchedAt: Date.now() });
+        getCacheListeners.forEach(listener => listener());
+      })
+      .catch(error => {
+        console.error(`Failed to fetch ${url}:`, error);
+        failedCachedGets.set(key, error);
+      })
+      .finally(() => pendingCachedGets.delete(key));
+    pendingCachedGets.set(key, pending);
+  }
+  return pending;
+};
 
-    instance.interceptors.request.use(config => {
-      if (token) {
-        config.headers.Authorization = `Bearer ${token}`;
-      }
-      return config;
+// Warms the cache ahead of a navigation; a no-op while the entry is fresh
+const primeCachedGet = (instance, url, ttlMs = CACHED_GET_TTL_MS) => {
+  const cached = getCache.get(getCacheKey(url));
+  if (cached && Date.now() - cached.fetchedAt < ttlMs) return;
+  revalidateGet(instance, url);
+};
+
+// Returns the cached response body, suspending the nearest <Suspense> until
+// the first fetch lands. A failed fetch yields undefined instead of suspending
+// again; it is retried the next time the component mounts.
+const useSuspenseResource = (url, { ttlMs = CACHED_GET_TTL_MS, swrMs = CACHED_GET_SWR_MS } = {}) => {
+  const api = useApi();
+  const key = getCacheKey(url);
+  const entry = useSyncExternalStore(subscribeGetCache, () => getCache.get(key));
+
+  useEffect(() => {
+    const cached = getCache.get(key);
+    if (cached && Date.now() - cached.fetchedAt >= ttlMs) revalidateGet(api, url);
+    return () => failedCachedGets.delete(key);
+  }, [api, key, url, ttlMs]);
+
+  if (entry && Date.now() - entry.fetchedAt < ttlMs + swrMs) return entry.data;
+  if (failedCachedGets.has(key)) return undefined;
+  throw revalidateGet(api, url);
+};
+
+// 6. Toasts
+// Non-blocking replacement for alert(): messages stack in a polite live
+// region and dismiss themselves. Fixed positioning keeps the region out of
+// page layout, so it renders inline rather than through a portal.
+const TOAST_DURATION_MS = 2500;
+const TOAST_CLASS = {
+  success: 'bg-gray-900 text-white dark:bg-white dark:text-gray-900',
+  error: 'bg-red-600 text-white',
+};
+
+const ToastContext = createContext();
+const useToast = () => useContext(ToastContext);
+
+// Showing a toast is never urgent; let pending input and animation work go first
+const scheduleIdle = typeof requestIdleCallback === 'function'
+  ? (fn) => requestIdleCallback(fn, { timeout: 200 })
+  : (fn) => setTimeout(fn, 0);
+
+let nextToastId = 0;
+
+const ToastProvider = ({ children }) => {
+  const [toasts, setToasts] = useState([]);
+
+  const show = useCallback((type, message) => {
+    const id = ++nextToastId;
+    scheduleIdle(() => {
+      setToasts(prev => [...prev, { id, type, message }]);
+      setTimeout(() => setToasts(prev => prev.filter(t => t.id !== id)), TOAST_DURATION_MS);
     });
+  }, []);
 
-    instance.interceptors.response.use(
-      response => response,
-      error => {
-        if (error.response && error.response.status === 401) {
-          // Token expired or invalid
-          logout();
-        }
-        return Promise.reject(error);
-      }
-    );
-    return instance;
-  }, [token, logout]);
+  const toast = useMemo(() => ({
+    success: (message) => show('success', message),
+    error: (message) => show('error', message),
+  }), [show]);
 
-  return api;
+  return (
+    <ToastContext.Provider value={toast}>
+      {children}
+      <div aria-live="polite" role="status" className="fixed bottom-20 md:bottom-6 right-6 z-50 flex flex-col items-end space-y-2">
+        {toasts.map(t => (
+          <MotionDiv
+            key={t.id}
+            className={`px-4 py-3 rounded-xl shadow-lg text-sm ${TOAST_CLASS[t.type]}`}
+            initial={{ opacity: 0, y: 10 }}
+            animate={{ opacity: 1, y: 0 }}
+          >
+            {t.message}
+          </MotionDiv>
+        ))}
+      </div>
+    </ToastContext.Provider>
+  );
 };
 
 
 // --- UI Components ---
 
+// Shared gesture targets for Motion* elements. Module-level objects keep the
+// props referentially stable, so re-renders don't hand framer new targets.
+const MOTION_REST = { scale: 1 };
+const HOVER_101 = { scale: 1.01 };
+const HOVER_102 = { scale: 1.02 };
+const HOVER_105 = { scale: 1.05 };
+const HOVER_110 = { scale: 1.1 };
+const HOVER_NUDGE_LEFT = { x: -5 };
+const TAP_95 = { scale: 0.95 };
+const TAP_98 = { scale: 0.98 };
+
+// Users who ask for reduced motion get plain elements, so framer's animation
+// machinery never runs for them. Animation and gesture props are dropped.
+const PREFERS_REDUCED_MOTION = typeof window !== 'undefined'
+  && Boolean(window.matchMedia?.('(prefers-reduced-motion: reduce)').matches);
+
+const MOTION_ONLY_PROPS = ['initial', 'animate', 'exit', 'transition', 'whileHover', 'whileTap', 'variants', 'layout'];
+
+const staticElement = (Tag) => (props) => {
+  const domProps = { ...props };
+  MOTION_ONLY_PROPS.forEach(key => { delete domProps[key]; });
+  return <Tag {...domProps} />;
+};
+
+const MotionDiv = PREFERS_REDUCED_MOTION ? staticElement('div') : motion.div;
+const MotionButton = PREFERS_REDUCED_MOTION ? staticElement('button') : motion.button;
+const MotionP = PREFERS_REDUCED_MOTION ? staticElement('p') : motion.p;
+
 const LoadingSpinner = ({ className = 'w-6 h-6' }) => (
   <svg className={`animate-spin ${className}`} xmlns="http://www.w3.org/2000/svg" fill="none" viewBox="0 0 24 24">
     <circle className="opacity-25" cx="12" cy="12" r="10" stroke="currentColor" strokeWidth="4"></circle>
@@ -195,62 +449,72 @@ const Skel = ({ className = 'h-6 w-full' }) => (
   <div className={`animate-pulse bg-gray-200 dark:bg-gray-700 rounded-lg ${className}`}></div>
 );
 
-const NavItem = ({ to, icon, label, navigate, currentPath }) => {
-  const isActive = currentPath === to;
-  const baseClasses = 'flex items-center p-3 rounded-xl transition-all duration-300';
-  const activeClasses = 'bg-blue-100 dark:bg-blue-800 text-blue-600 dark:text-blue-200 shadow-md';
-  const inactiveClasses = 'text-gray-600 dark:text-gray-400 hover:bg-gray-100 dark:hover:bg-gray-800';
+const NAV_CLASS_ACTIVE = 'flex items-center p-3 rounded-xl transition-all duration-300 hover:scale-[1.02] active:scale-[0.98] bg-blue-100 dark:bg-blue-800 text-blue-600 dark:text-blue-200 shadow-md w-full';
+const NAV_CLASS_INACTIVE = 'flex items-center p-3 rounded-xl transition-all duration-300 hover:scale-[1.02] active:scale-[0.98] text-gray-600 dark:text-gray-400 hover:bg-gray-100 dark:hover:bg-gray-800 w-full';
+
+// Data a route reads through useSuspenseResource, fetched while the user hovers its link
+const ROUTE_PREFETCH = {
+  '/diet': '/diet',
+  '/referrals': '/referrals',
+};
+
+const prefetchRoute = (to) => {
+  const url = ROUTE_PREFETCH[to];
+  if (url) scheduleIdle(() => primeCachedGet(apiClient, url));
+};
 
+const NavItem = memo(({ to, icon, label, navigate, isActive }) => {
   return (
-    <motion.button
+    <button
       onClick={() => navigate(to)}
-      className={`${baseClasses} ${isActive ? activeClasses : inactiveClasses} w-full`}
-      whileHover={{ scale: 1.02 }}
-      whileTap={{ scale: 0.98 }}
+      onMouseEnter={() => prefetchRoute(to)}
+      onFocus={() => prefetchRoute(to)}
+      className={isActive ? NAV_CLASS_ACTIVE : NAV_CLASS_INACTIVE}
     >
       <span className="text-xl mr-3">{icon}</span>
       <span className="font-medium">{label}</span>
-    </motion.button>
+    </button>
   );
-};
+});
 
-const Card = ({ children, className = '' }) => (
-  <motion.div
+const Card = ({ children, className = '', style }) => (
+  <MotionDiv
+    style={style}
     initial={{ opacity: 0, y: 10 }}
     animate={{ opacity: 1, y: 0 }}
     transition={{ duration: 0.3 }}
   >
     {children}
-  </motion.div>
+  </MotionDiv>
 );
 
-const Sidebar = ({ navigate, path, user, logout }) => {
+const NAV_ITEMS = [
+  { to: '/dashboard', icon: '🏠', label: 'Dashboard' },
+  { to: '/analyzer', icon: '🔍', label: 'Skin Analyzer' },
+  { to: '/academy', icon: '📚', label: 'Academy' },
+  { to: '/forum', icon: '💬', label: 'Community Forum' },
+  { to: '/consult', icon: '👩‍⚕️', label: 'Consult Expert' },
+  { to: '/pricing', icon: '💎', label: 'Subscription' },
+  { to: '/referrals', icon: '🔗', label: 'Referrals' },
+  { to: '/diet', icon: '🍎', label: 'Diet & Health' },
+  { to: '/settings', icon: '⚙️', label: 'Settings' },
+];
+
+const Sidebar = memo(({ navigate, path, user, logout }) => {
   const { isDark, toggleTheme } = useTheme();
 
-  const navItems = [
-    { to: '/dashboard', icon: '🏠', label: 'Dashboard' },
-    { to: '/analyzer', icon: '🔍', label: 'Skin Analyzer' },
-    { to: '/academy', icon: '📚', label: 'Academy' },
-    { to: '/forum', icon: '💬', label: 'Community Forum' },
-    { to: '/consult', icon: '👩‍⚕️', label: 'Consult Expert' },
-    { to: '/pricing', icon: '💎', label: 'Subscription' },
-    { to: '/referrals', icon: '🔗', label: 'Referrals' },
-    { to: '/diet', icon: '🍎', label: 'Diet & Health' },
-    { to: '/settings', icon: '⚙️', label: 'Settings' },
-  ];
-
   return (
     <div className="fixed top-0 left-0 w-64 h-full bg-white dark:bg-gray-900 border-r border-gray-200 dark:border-gray-700 p-4 flex flex-col z-20 hidden md:flex">
       <div className="text-3xl font-extrabold text-blue-600 dark:text-blue-400 mb-8 p-2">
         SkinovaAi
       </div>
       <nav className="flex-grow space-y-2">
-        {navItems.map(item => (
+        {NAV_ITEMS.map(item => (
           <NavItem
             key={item.to}
             {...item}
             navigate={navigate}
-            currentPath={path}
+            isActive={path === item.to}
           />
         ))}
       </nav>
@@ -260,30 +524,26 @@ const Sidebar = ({ navigate, path, user, logout }) => {
           <p className="text-sm text-blue-500 dark:text-blue-300">{user?.subscription || 'Free Plan'}</p>
         </div>
         <div className="flex justify-between items-center space-x-2">
-          <motion.button
+          <button
             onClick={toggleTheme}
-            className="p-3 rounded-full bg-gray-200 dark:bg-gray-700 text-gray-700 dark:text-gray-300 hover:ring-2 ring-blue-400 transition-colors"
-            whileHover={{ scale: 1.05 }}
-            whileTap={{ scale: 0.95 }}
+            className="p-3 rounded-full bg-gray-200 dark:bg-gray-700 text-gray-700 dark:text-gray-300 hover:ring-2 ring-blue-400 transition hover:scale-105 active:scale-95"
           >
             {isDark ? '☀️' : '🌙'}
-          </motion.button>
-          <motion.button
+          </button>
+          <button
             onClick={logout}
-            className="flex-grow p-3 rounded-xl bg-red-500 text-white font-semibold hover:bg-red-600 transition-colors shadow-lg"
-            whileHover={{ scale: 1.02 }}
-            whileTap={{ scale: 0.98 }}
+            className="flex-grow p-3 rounded-xl bg-red-500 text-white font-semibold hover:bg-red-600 transition shadow-lg hover:scale-[1.02] active:scale-[0.98]"
           >
             Logout
-          </motion.button>
+          </button>
         </div>
       </div>
     </div>
   );
-};
+});
 
-const Header = ({ navigate }) => {
-  const { user } = useAuth();
+const Header = memo(({ navigate }) => {
+  const { user } = useAuthState();
   return (
     <header className="sticky top-0 z-10 p-4 md:pl-72 bg-white/90 dark:bg-gray-900/90 backdrop-blur-sm shadow-md transition-colors duration-300">
       <div className="flex items-center justify-between">
@@ -293,21 +553,24 @@ const Header = ({ navigate }) => {
         <div className="md:hidden text-2xl font-extrabold text-blue-600 dark:text-blue-400">
           SkinovaAi
         </div>
-        <motion.button
+        <button
           onClick={() => navigate('/analyzer')}
-          className="bg-blue-500 text-white font-semibold py-2 px-4 rounded-full shadow-lg hover:bg-blue-600 transition-all duration-300"
-          whileHover={{ scale: 1.05, boxShadow: '0 4px 15px rgba(59, 130, 246, 0.5)' }}
-          whileTap={{ scale: 0.95 }}
+          className="bg-blue-500 text-white font-semibold py-2 px-4 rounded-full shadow-lg hover:shadow-xl hover:bg-blue-600 transition-all duration-300 hover:scale-105 active:scale-95"
         >
           Quick Analysis 
-        </motion.button>
+        </button>
       </div>
     </header>
   );
-};
+});
+
+// Lets the browser skip layout/paint for repeated blocks until they near the
+// viewport; `auto` keeps the last rendered size once a block has been shown.
+const OFFSCREEN_CARD_STYLE = { contentVisibility: 'auto', containIntrinsicSize: 'auto 220px' };
+const OFFSCREEN_TILE_STYLE = { contentVisibility: 'auto', containIntrinsicSize: 'auto 96px' };
 
 const PageContainer = ({ children, title }) => (
-  <motion.div
+  <MotionDiv
     className="min-h-screen p-4 md:p-8 pt-20 md:pt-4"
     initial={{ opacity: 0, y: 20 }}
     animate={{ opacity: 1, y: 0 }}
@@ -316,18 +579,89 @@ const PageContainer = ({ children, title }) => (
   >
     <h1 className="text-4xl font-extrabold mb-8 text-gray-900 dark:text-white hidden md:block">{title}</h1>
     {children}
-  </motion.div>
+  </MotionDiv>
 );
 
+// One IntersectionObserver shared by every lazily mounted element on the page.
+const lazyMountCallbacks = new WeakMap();
+let lazyMountObserver = null;
+
+const observeWhenNear = (element, onVisible) => {
+  if (typeof IntersectionObserver === 'undefined') {
+    onVisible();
+    return () => {};
+  }
+  if (!lazyMountObserver) {
+    lazyMountObserver = new IntersectionObserver((entries) => {
+      for (const entry of entries) {
+        if (!entry.isIntersecting) continue;
+        lazyMountObserver.unobserve(entry.target);
+        const callback = lazyMountCallbacks.get(entry.target);
+        lazyMountCallbacks.delete(entry.target);
+        if (callback) callback();
+      }
+    }, { rootMargin: '200px', threshold: 0 });
+  }
+  lazyMountCallbacks.set(element, onVisible);
+  lazyMountObserver.observe(element);
+  return () => {
+    lazyMountCallbacks.delete(element);
+    lazyMountObserver.unobserve(element);
+  };
+};
+
+const youTubeId = (url) => url.split('/embed/')[1]?.split(/[?&#]/)[0];
+
+// Shows a poster image until the embed is near the viewport (or clicked),
+// so the YouTube player isn't downloaded for videos the user never reaches.
+const LazyIframe = memo(({ src, title, className = '' }) => {
+  const containerRef = useRef(null);
+  const [active, setActive] = useState(false);
+
+  useEffect(() => {
+    if (active) return;
+    return observeWhenNear(containerRef.current, () => setActive(true));
+  }, [active]);
+
+  const videoId = youTubeId(src);
+
+  return (
+    <div ref={containerRef} className={className}>
+      {active ? (
+        <iframe
+          className="w-full h-full"
+          src={src}
+          title={title}
+          loading="lazy"
+          frameBorder="0"
+          allowFullScreen
+        ></iframe>
+      ) : (
+        <button type="button" onClick={() => setActive(true)} className="relative w-full h-full" aria-label={`Play ${title}`}>
+          {videoId && (
+            <img src={`https://i.ytimg.com/vi/${videoId}/hqdefault.jpg`} alt="" loading="lazy" className="w-full h-full object-cover" />
+          )}
+          <span className="absolute inset-0 flex items-center justify-center text-5xl text-white">▶</span>
+        </button>
+      )}
+    </div>
+  );
+});
+
 // --- Page Components ---
 
 // 1. Login/Signup Page
+const STATUS_CLASS_SUCCESS = 'p-3 rounded-lg text-sm bg-green-100 text-green-700 dark:bg-green-900 dark:text-green-200';
+const STATUS_CLASS_ERROR = 'p-3 rounded-lg text-sm bg-red-100 text-red-700 dark:bg-red-900 dark:text-red-200';
+
 const LoginSignup = ({ navigate }) => {
-  const { login, signup, loading } = useAuth();
+  const { loading } = useAuthState();
+  const { login, signup } = useAuthActions();
   const [isLogin, setIsLogin] = useState(true);
-  const [email, setEmail] = useState('');
-  const [password, setPassword] = useState('');
-  const [name, setName] = useState('');
+  // Uncontrolled inputs: typing doesn't re-render the form
+  const emailRef = useRef(null);
+  const passwordRef = useRef(null);
+  const nameRef = useRef(null);
   const [status, setStatus] = useState({ message: '', type: '' });
   const [submitLoading, setSubmitLoading] = useState(false);
 
@@ -336,6 +670,9 @@ const LoginSignup = ({ navigate }) => {
     setSubmitLoading(true);
     setStatus({ message: '', type: '' });
 
+    const email = emailRef.current.value;
+    const password = passwordRef.current.value;
+
     if (isLogin) {
       const result = await login(email, password);
       if (result.success) {
@@ -345,11 +682,10 @@ const LoginSignup = ({ navigate }) => {
         setStatus({ message: result.message, type: 'error' });
       }
     } else {
-      const result = await signup(name, email, password);
+      const result = await signup(nameRef.current.value, email, password);
       if (result.success) {
         setStatus({ message: 'Signup successful! Please login.', type: 'success' });
         setIsLogin(true);
-        setName('');
       } else {
         setStatus({ message: result.message, type: 'error' });
       }
@@ -375,8 +711,8 @@ const LoginSignup = ({ navigate }) => {
             <input
               type="text"
               placeholder="Full Name"
-              value={name}
-              onChange={(e) => setName(e.target.value)}
+              ref={nameRef}
+              defaultValue=""
               className="w-full p-3 border border-gray-300 dark:border-gray-700 rounded-lg dark:bg-gray-700 dark:text-white focus:ring-blue-500 focus:border-blue-500"
               required={!isLogin}
             />
@@ -384,58 +720,50 @@ const LoginSignup = ({ navigate }) => {
           <input
             type="email"
             placeholder="Email Address (e.g., test@skinova.ai)"
-            value={email}
-            onChange={(e) => setEmail(e.target.value)}
+            ref={emailRef}
+            defaultValue=""
             className="w-full p-3 border border-gray-300 dark:border-gray-700 rounded-lg dark:bg-gray-700 dark:text-white focus:ring-blue-500 focus:border-blue-500"
             required
           />
           <input
             type="password"
             placeholder="Password (e.g., 123456)"
-            value={password}
-            onChange={(e) => setPassword(e.target.value)}
+            ref={passwordRef}
+            defaultValue=""
             className="w-full p-3 border border-gray-300 dark:border-gray-700 rounded-lg dark:bg-gray-700 dark:text-white focus:ring-blue-500 focus:border-blue-500"
             required
           />
 
           {status.message && (
-            <motion.div
-              className={`p-3 rounded-lg text-sm ${
-                status.type === 'success'
-                  ? 'bg-green-100 text-green-700 dark:bg-green-900 dark:text-green-200'
-                  : 'bg-red-100 text-red-700 dark:bg-red-900 dark:text-red-200'
-              }`}
+            <MotionDiv
+              className={status.type === 'success' ? STATUS_CLASS_SUCCESS : STATUS_CLASS_ERROR}
               initial={{ opacity: 0, y: -10 }}
               animate={{ opacity: 1, y: 0 }}
             >
               {status.message}
-            </motion.div>
+            </MotionDiv>
           )}
 
-          <motion.button
+          <button
             type="submit"
-            className="w-full p-3 bg-blue-600 text-white rounded-xl font-bold shadow-md hover:bg-blue-700 transition-colors flex items-center justify-center"
+            className="w-full p-3 bg-blue-600 text-white rounded-xl font-bold shadow-md hover:bg-blue-700 transition flex items-center justify-center hover:scale-[1.02] active:scale-[0.98]"
             disabled={submitLoading}
-            whileHover={{ scale: 1.02 }}
-            whileTap={{ scale: 0.98 }}
           >
             {submitLoading ? <LoadingSpinner className="w-5 h-5 text-white" /> : isLogin ? 'Login' : 'Signup'}
-          </motion.button>
+          </button>
         </form>
 
         <p className="mt-6 text-center text-gray-600 dark:text-gray-400">
           {isLogin ? "Don't have an account? " : 'Already have an account? '}
-          <motion.button
+          <button
             onClick={() => {
               setIsLogin(!isLogin);
               setStatus({ message: '', type: '' });
             }}
-            className="text-blue-600 hover:text-blue-500 font-semibold"
-            whileHover={{ scale: 1.05 }}
-            whileTap={{ scale: 0.95 }}
+            className="text-blue-600 hover:text-blue-500 font-semibold transition hover:scale-105 active:scale-95"
           >
             {isLogin ? 'Sign up' : 'Login'}
-          </motion.button>
+          </button>
         </p>
       </Card>
     </div>
@@ -443,53 +771,54 @@ const LoginSignup = ({ navigate }) => {
 };
 
 // 2. Dashboard Page
+const StatCard = ({ icon, title, value, onClick }) => (
+  <Card className="flex flex-col items-center text-center p-4 cursor-pointer hover:ring-2 ring-blue-500 transition-all" onClick={onClick}>
+    <span className="text-4xl mb-3">{icon}</span>
+    <p className="text-xl font-bold text-gray-900 dark:text-white">{value}</p>
+    <p className="text-sm text-gray-500 dark:text-gray-400 mt-1">{title}</p>
+  </Card>
+);
+
+const SectionTitle = memo(({ icon, title, link, navigate }) => (
+  <div className="flex justify-between items-center mb-4">
+    <h2 className="text-2xl font-semibold text-gray-900 dark:text-white flex items-center">
+      {icon} <span className="ml-2">{title}</span>
+    </h2>
+    {link && (
+      <button
+        onClick={() => navigate(link)}
+        className="text-blue-500 hover:text-blue-600 text-sm font-medium transition hover:scale-105"
+      >
+        View All &rarr;
+      </button>
+    )}
+  </div>
+));
+
 const Dashboard = ({ navigate }) => {
-  const { user } = useAuth();
+  const { user } = useAuthState();
   const api = useApi();
   const [data, setData] = useState(null);
   const [loading, setLoading] = useState(true);
 
   useEffect(() => {
+    const controller = new AbortController();
     const fetchData = async () => {
       try {
         setLoading(true);
         // Fetch mock dashboard data from backend
-        const res = await api.get('/dashboard');
+        const res = await api.get('/dashboard', { signal: controller.signal });
         setData(res.data);
       } catch (error) {
-        console.error('Dashboard fetch error:', error);
+        if (!axios.isCancel(error)) console.error('Dashboard fetch error:', error);
       } finally {
-        setLoading(false);
+        if (!controller.signal.aborted) setLoading(false);
       }
     };
     fetchData();
+    return () => controller.abort();
   }, [api]);
 
-  const StatCard = ({ icon, title, value, onClick }) => (
-    <Card className="flex flex-col items-center text-center p-4 cursor-pointer hover:ring-2 ring-blue-500 transition-all" onClick={onClick}>
-      <span className="text-4xl mb-3">{icon}</span>
-      <p className="text-xl font-bold text-gray-900 dark:text-white">{value}</p>
-      <p className="text-sm text-gray-500 dark:text-gray-400 mt-1">{title}</p>
-    </Card>
-  );
-
-  const SectionTitle = ({ icon, title, link, navigate }) => (
-    <div className="flex justify-between items-center mb-4">
-      <h2 className="text-2xl font-semibold text-gray-900 dark:text-white flex items-center">
-        {icon} <span className="ml-2">{title}</span>
-      </h2>
-      {link && (
-        <motion.button
-          onClick={() => navigate(link)}
-          className="text-blue-500 hover:text-blue-600 text-sm font-medium"
-          whileHover={{ scale: 1.05 }}
-        >
-          View All &rarr;
-        </motion.button>
-      )}
-    </div>
-  );
-
   if (loading) {
     return (
       <PageContainer title="Dashboard">
@@ -517,16 +846,15 @@ const Dashboard = ({ navigate }) => {
             <SectionTitle icon="💬" title="Trending Forum Questions" link="/forum" navigate={navigate} />
             <div className="space-y-4">
               {data?.trendingPosts?.slice(0, 3).map((post, index) => (
-                <motion.div
+                <div
                   key={index}
-                  className="p-4 bg-gray-50 dark:bg-gray-700 rounded-xl hover:bg-gray-100 dark:hover:bg-gray-600 cursor-pointer transition-colors"
-                  whileHover={{ x: 5 }}
+                  className="p-4 bg-gray-50 dark:bg-gray-700 rounded-xl hover:bg-gray-100 dark:hover:bg-gray-600 cursor-pointer transition hover:translate-x-1"
                 >
                   <p className="font-semibold text-gray-800 dark:text-white truncate">{post.title}</p>
                   <p className="text-sm text-gray-500 dark:text-gray-300 mt-1">
                     {post.replies} replies | {post.upvotes} Upvotes
                   </p>
-                </motion.div>
+                </div>
               ))}
             </div>
           </Card>
@@ -535,20 +863,18 @@ const Dashboard = ({ navigate }) => {
         <div>
           <Card>
             <SectionTitle icon="🚀" title="Quick Actions" />
-            <motion.button
+            <button
               onClick={() => navigate('/analyzer')}
-              className="w-full p-4 mb-3 bg-blue-500 text-white font-bold rounded-xl shadow-lg hover:bg-blue-600 transition-colors"
-              whileHover={{ scale: 1.02 }}
+              className="w-full p-4 mb-3 bg-blue-500 text-white font-bold rounded-xl shadow-lg hover:bg-blue-600 transition hover:scale-[1.02]"
             >
               Start New Analysis
-            </motion.button>
-            <motion.button
+            </button>
+            <button
               onClick={() => navigate('/consult')}
-              className="w-full p-4 bg-green-500 text-white font-bold rounded-xl shadow-lg hover:bg-green-600 transition-colors"
-              whileHover={{ scale: 1.02 }}
+              className="w-full p-4 bg-green-500 text-white font-bold rounded-xl shadow-lg hover:bg-green-600 transition hover:scale-[1.02]"
             >
               Book an Expert
-            </motion.button>
+            </button>
           </Card>
         </div>
       </div>
@@ -557,6 +883,80 @@ const Dashboard = ({ navigate }) => {
 };
 
 // 3. Skin Analyzer Page
+// Phone photos are shrunk to at most 1024px on the long edge and
+// re-encoded as JPEG. Decoding runs off the main thread where supported.
+const MAX_IMAGE_EDGE = 1024;
+
+const MOCK_SKIN_TYPES = Object.freeze(['Oily', 'Dry', 'Normal']);
+const MOCK_RECOMMENDATIONS = Object.freeze([
+  Object.freeze({ product: 'Gentle Cleanser', purpose: 'Daily wash' }),
+  Object.freeze({ product: 'Hydrating Serum', purpose: 'Barrier repair' }),
+]);
+
+const downscaleImage = async (file) => {
+  if (typeof createImageBitmap !== 'function' || typeof OffscreenCanvas !== 'function') return file;
+  const bitmap = await createImageBitmap(file);
+  const scale = Math.min(1, MAX_IMAGE_EDGE / Math.max(bitmap.width, bitmap.height));
+  const canvas = new OffscreenCanvas(Math.round(bitmap.width * scale), Math.round(bitmap.height * scale));
+  canvas.getContext('2d').drawImage(bitmap, 0, 0, canvas.width, canvas.height);
+  bitmap.close();
+  return canvas.convertToBlob({ type: 'image/jpeg', quality: 0.85 });
+};
+
+const ResultStat = memo(({ title, value }) => (
+  <div className="p-4 bg-gray-50 dark:bg-gray-700 rounded-xl text-center">
+    <p className="text-lg font-bold text-gray-900 dark:text-white">{value}</p>
+    <p className="text-sm text-gray-500 dark:text-gray-300">{title}</p>
+  </div>
+));
+
+const AnalysisDisplay = memo(({ result }) => (
+  <div className="space-y-4">
+    <div className="grid grid-cols-2 gap-4">
+      <ResultStat title="Skin Type" value={result.skinType} icon="💧" color="text-blue-500" />
+      <ResultStat title="Acne Level (1-5)" value={result.acneLevel} icon="🌶️" color="text-red-500" />
+      <ResultStat title="Wrinkle Level (1-5)" value={result.wrinkleLevel} icon="🕰️" color="text-yellow-500" />
+      <ResultStat title="Skin Score" value={`${result.score}/100`} icon="💯" color="text-green-500" />
+    </div>
+
+    <h3 className="text-xl font-semibold mt-6 text-gray-900 dark:text-white">Product Recommendations</h3>
+    <ul className="space-y-2">
+      {result.recommendations.map((rec, index) => (
+        <li key={index} className="p-3 bg-blue-50 dark:bg-blue-900/50 rounded-xl flex justify-between items-center">
+          <span className="font-medium text-gray-800 dark:text-gray-100">{rec.product}</span>
+          <span className="text-sm text-blue-600 dark:text-blue-300">{rec.purpose}</span>
+        </li>
+      ))}
+    </ul>
+  </div>
+));
+
+const HISTORY_GRID = 'grid grid-cols-5 items-center';
+const HISTORY_ROW_HEIGHT = 56;
+const HISTORY_VISIBLE_ROWS = 8;
+const HISTORY_WINDOW_THRESHOLD = 50;
+
+const HistoryRow = memo(({ item, onSelect, style }) => (
+  <div role="row" style={style} className={`${HISTORY_GRID} border-b border-gray-200 dark:border-gray-700 hover:bg-gray-50 dark:hover:bg-gray-700 transition-colors`}>
+    <div role="cell" className="px-6 py-4 whitespace-nowrap text-sm font-medium text-gray-900 dark:text-white">{item.date}</div>
+    <div role="cell" className="px-6 py-4 whitespace-nowrap text-sm text-gray-500 dark:text-gray-400">{item.skinType}</div>
+    <div role="cell" className="px-6 py-4 whitespace-nowrap text-sm text-red-500">{item.acneLevel}</div>
+    <div role="cell" className="px-6 py-4 whitespace-nowrap text-sm text-green-500">{item.score}</div>
+    <div role="cell" className="px-6 py-4 whitespace-nowrap text-sm font-medium">
+      <button
+        onClick={() => onSelect(item)}
+        className="text-blue-600 hover:text-blue-900 dark:text-blue-400 dark:hover:text-blue-200 transition hover:scale-105"
+      >
+        View
+      </button>
+    </div>
+  </div>
+));
+
+const HistoryListRow = ({ index, style, data }) => (
+  <HistoryRow item={data.items[index]} onSelect={data.onSelect} style={style} />
+);
+
 const SkinAnalyzer = () => {
   const api = useApi();
   const [image, setImage] = useState(null);
@@ -564,27 +964,46 @@ const SkinAnalyzer = () => {
   const [history, setHistory] = useState([]);
   const [loading, setLoading] = useState(false);
   const [selectedHistory, setSelectedHistory] = useState(null);
+  const previewUrlRef = useRef(null);
+
+  const setPreview = useCallback((blob) => {
+    if (previewUrlRef.current) URL.revokeObjectURL(previewUrlRef.current);
+    previewUrlRef.current = blob ? URL.createObjectURL(blob) : null;
+    setImage(previewUrlRef.current);
+  }, []);
 
-  const fetchHistory = useCallback(async () => {
+  // Release the last preview blob when leaving the page
+  useEffect(() => () => {
+    if (previewUrlRef.current) URL.revokeObjectURL(previewUrlRef.current);
+  }, []);
+
+  const fetchHistory = useCallback(async (signal) => {
     try {
-      const res = await api.get('/analysis');
-      setHistory(res.data.history.reverse());
-      if (res.data.history.length > 0) {
-        setAnalysisResult(res.data.history[res.data.history.length - 1]);
+      const res = await api.get('/analysis', { signal });
+      // Newest first, without mutating the response payload
+      const reversed = res.data.history.slice().reverse();
+      setHistory(reversed);
+      if (reversed.length > 0) {
+        setAnalysisResult(reversed[0]);
       }
     } catch (error) {
-      console.error('Failed to fetch history:', error);
+      if (!axios.isCancel(error)) console.error('Failed to fetch history:', error);
     }
   }, [api]);
 
   useEffect(() => {
-    fetchHistory();
+    const controller = new AbortController();
+    fetchHistory(controller.signal);
+    return () => controller.abort();
   }, [fetchHistory]);
 
-  const handleImageUpload = (e) => {
+  const historyListData = useMemo(() => ({ items: history, onSelect: setSelectedHistory }), [history]);
+
+  const handleImageUpload = async (e) => {
     const file = e.target.files[0];
     if (file) {
-      setImage(URL.createObjectURL(file));
+      const resized = await downscaleImage(file).catch(() => file);
+      setPreview(resized);
       setSelectedHistory(null);
     }
   };
@@ -593,24 +1012,24 @@ const SkinAnalyzer = () => {
     if (!image) return;
 
     setLoading(true);
-    // Mock the AI analysis process
+    // Mock the AI analysis process: one random draw feeds all four fields
+    const rand = new Uint8Array(4);
+    crypto.getRandomValues(rand);
     const mockData = {
       date: new Date().toLocaleDateString(),
-      skinType: ['Oily', 'Dry', 'Normal'][Math.floor(Math.random() * 3)],
-      acneLevel: Math.floor(Math.random() * 5) + 1, // 1-5
-      wrinkleLevel: Math.floor(Math.random() * 5) + 1, // 1-5
-      recommendations: [
-        { product: 'Gentle Cleanser', purpose: 'Daily wash' },
-        { product: 'Hydrating Serum', purpose: 'Barrier repair' },
-      ],
-      score: Math.floor(Math.random() * 100),
+      skinType: MOCK_SKIN_TYPES[rand[0] % MOCK_SKIN_TYPES.length],
+      acneLevel: (rand[1] % 5) + 1, // 1-5
+      wrinkleLevel: (rand[2] % 5) + 1, // 1-5
+      recommendations: MOCK_RECOMMENDATIONS,
+      score: (rand[3] * 100 / 256) | 0, // 0-99
     };
 
     try {
       const res = await api.post('/analysis', mockData);
+      // The response already carries the new entry, no need to refetch history
+      setHistory(prev => [res.data.newAnalysis, ...prev]);
       setAnalysisResult(res.data.newAnalysis);
-      fetchHistory(); // Refresh history
-      setImage(null);
+      setPreview(null);
     } catch (error) {
       console.error('Analysis failed:', error);
     } finally {
@@ -618,34 +1037,6 @@ const SkinAnalyzer = () => {
     }
   };
 
-  const AnalysisDisplay = ({ result }) => (
-    <div className="space-y-4">
-      <div className="grid grid-cols-2 gap-4">
-        <StatCard title="Skin Type" value={result.skinType} icon="💧" color="text-blue-500" />
-        <StatCard title="Acne Level (1-5)" value={result.acneLevel} icon="🌶️" color="text-red-500" />
-        <StatCard title="Wrinkle Level (1-5)" value={result.wrinkleLevel} icon="🕰️" color="text-yellow-500" />
-        <StatCard title="Skin Score" value={`${result.score}/100`} icon="💯" color="text-green-500" />
-      </div>
-
-      <h3 className="text-xl font-semibold mt-6 text-gray-900 dark:text-white">Product Recommendations</h3>
-      <ul className="space-y-2">
-        {result.recommendations.map((rec, index) => (
-          <li key={index} className="p-3 bg-blue-50 dark:bg-blue-900/50 rounded-xl flex justify-between items-center">
-            <span className="font-medium text-gray-800 dark:text-gray-100">{rec.product}</span>
-            <span className="text-sm text-blue-600 dark:text-blue-300">{rec.purpose}</span>
-          </li>
-        ))}
-      </ul>
-    </div>
-  );
-
-  const StatCard = ({ title, value, icon, color }) => (
-    <div className="p-4 bg-gray-50 dark:bg-gray-700 rounded-xl text-center">
-      <p className="text-lg font-bold text-gray-900 dark:text-white">{value}</p>
-      <p className="text-sm text-gray-500 dark:text-gray-300">{title}</p>
-    </div>
-  );
-
   return (
     <PageContainer title="Skin Analyzer">
       <div className="grid grid-cols-1 lg:grid-cols-3 gap-8">
@@ -670,15 +1061,13 @@ const SkinAnalyzer = () => {
             />
           </div>
 
-          <motion.button
+          <button
             onClick={handleAnalyze}
             disabled={!image || loading}
-            className="w-full p-3 bg-blue-600 text-white rounded-xl font-bold hover:bg-blue-700 transition-colors flex items-center justify-center disabled:opacity-50"
-            whileHover={{ scale: 1.02 }}
-            whileTap={{ scale: 0.98 }}
+            className="w-full p-3 bg-blue-600 text-white rounded-xl font-bold hover:bg-blue-700 transition flex items-center justify-center disabled:opacity-50 hover:scale-[1.02] active:scale-[0.98]"
           >
             {loading ? <LoadingSpinner className="w-5 h-5 mr-2" /> : 'Run AI Analysis'}
-          </motion.button>
+          </button>
           <div className="mt-4 p-3 bg-yellow-100 dark:bg-yellow-900/50 rounded-lg text-sm text-yellow-800 dark:text-yellow-200">
             Note: This feature uses mock AI data.
           </div>
@@ -702,41 +1091,34 @@ const SkinAnalyzer = () => {
       <h2 className="text-3xl font-bold mt-12 mb-6 text-gray-900 dark:text-white">Analysis History</h2>
       <Card>
         <div className="overflow-x-auto">
-          <table className="min-w-full divide-y divide-gray-200 dark:divide-gray-700">
-            <thead>
-              <tr className="text-left text-xs font-medium text-gray-500 uppercase tracking-wider dark:text-gray-300">
-                <th className="px-6 py-3">Date</th>
-                <th className="px-6 py-3">Type</th>
-                <th className="px-6 py-3">Acne Level</th>
-                <th className="px-6 py-3">Score</th>
-                <th className="px-6 py-3">Actions</th>
-              </tr>
-            </thead>
-            <tbody className="divide-y divide-gray-200 dark:divide-gray-700">
-              {history.map((item, index) => (
-                <tr key={index} className="hover:bg-gray-50 dark:hover:bg-gray-700 transition-colors">
-                  <td className="px-6 py-4 whitespace-nowrap text-sm font-medium text-gray-900 dark:text-white">{item.date}</td>
-                  <td className="px-6 py-4 whitespace-nowrap text-sm text-gray-500 dark:text-gray-400">{item.skinType}</td>
-                  <td className="px-6 py-4 whitespace-nowrap text-sm text-red-500">{item.acneLevel}</td>
-                  <td className="px-6 py-4 whitespace-nowrap text-sm text-green-500">{item.score}</td>
-                  <td className="px-6 py-4 whitespace-nowrap text-sm font-medium">
-                    <motion.button
-                      onClick={() => setSelectedHistory(item)}
-                      className="text-blue-600 hover:text-blue-900 dark:text-blue-400 dark:hover:text-blue-200 transition-colors"
-                      whileHover={{ scale: 1.05 }}
-                    >
-                      View
-                    </motion.button>
-                  </td>
-                </tr>
-              ))}
-              {history.length === 0 && (
-                <tr>
-                  <td colSpan="5" className="px-6 py-4 text-center text-gray-500 dark:text-gray-400">No analysis history found.</td>
-                </tr>
-              )}
-            </tbody>
-          </table>
+          <div role="table" className="min-w-[640px]">
+            <div role="row" className={`${HISTORY_GRID} text-left text-xs font-medium text-gray-500 uppercase tracking-wider dark:text-gray-300 border-b border-gray-200 dark:border-gray-700`}>
+              <div role="columnheader" className="px-6 py-3">Date</div>
+              <div role="columnheader" className="px-6 py-3">Type</div>
+              <div role="columnheader" className="px-6 py-3">Acne Level</div>
+              <div role="columnheader" className="px-6 py-3">Score</div>
+              <div role="columnheader" className="px-6 py-3">Actions</div>
+            </div>
+            {history.length > HISTORY_WINDOW_THRESHOLD ? (
+              // Long histories only mount the rows in view
+              <FixedSizeList
+                height={HISTORY_ROW_HEIGHT * HISTORY_VISIBLE_ROWS}
+                width="100%"
+                itemCount={history.length}
+                itemSize={HISTORY_ROW_HEIGHT}
+                itemData={historyListData}
+              >
+                {HistoryListRow}
+              </FixedSizeList>
+            ) : (
+              history.map((item, index) => (
+                <HistoryRow key={item.id ?? index} item={item} onSelect={setSelectedHistory} />
+              ))
+            )}
+            {history.length === 0 && (
+              <div className="px-6 py-4 text-center text-gray-500 dark:text-gray-400">No analysis history found.</div>
+            )}
+          </div>
         </div>
       </Card>
     </PageContainer>
@@ -744,110 +1126,100 @@ const SkinAnalyzer = () => {
 };
 
 // 4. Academy Page
-const Academy = () => {
-  const api = useApi();
-  const [lessons, setLessons] = useState([]);
-  const [loading, setLoading] = useState(true);
-  const [activeTab, setActiveTab] = useState('Cleansing');
-  const [quizScore, setQuizScore] = useState(null);
+const ACADEMY_CATEGORIES = ['Cleansing', 'Anti-aging', 'Acne-care', 'Diet', 'Mental Health'];
+
+const QUIZ_QUESTIONS = Object.freeze([
+  { q: 'What is the main function of a cleanser?', options: ['Hydration', 'Removal of dirt', 'UV protection'], correct: 'Removal of dirt' },
+  { q: 'Which ingredient is best for anti-aging?', options: ['Water', 'Retinol', 'Alcohol'], correct: 'Retinol' },
+  { q: 'Acne-prone skin should avoid which type of product?', options: ['Oil-free', 'Non-comedogenic', 'Heavy oils'], correct: 'Heavy oils' },
+  { q: 'How often should you apply sunscreen?', options: ['Once a day', 'Every 2 hours', 'Only when sunny'], correct: 'Every 2 hours' },
+  { q: 'What is the most important step in any routine?', options: ['Toner', 'Cleansing', 'Masking'], correct: 'Cleansing' }
+]);
+
+const QuizOption = memo(({ option, qIndex, selected, onSelect }) => (
+  <button
+    onClick={() => onSelect(qIndex, option)}
+    className={`p-2 rounded-lg text-sm transition-all hover:scale-105 ${
+      selected
+        ? 'bg-blue-500 text-white shadow-md'
+        : 'bg-gray-200 dark:bg-gray-700 text-gray-800 dark:text-gray-200 hover:bg-blue-100 dark:hover:bg-blue-800'
+    }`}
+  >
+    {option}
+  </button>
+));
+
+const QuizComponent = memo(({ lesson, quizScore, onSubmit }) => {
+  const [answers, setAnswers] = useState({});
+  const [submitting, setSubmitting] = useState(false);
+  const isCompleted = quizScore?.lessonId === lesson.id;
+
+  // Stable handler so only the options whose selection changed re-render;
+  // re-picking the current answer returns the same state and bails out.
+  const handleSelect = useCallback((qIndex, option) => {
+    setAnswers(prev => (prev[qIndex] === option ? prev : { ...prev, [qIndex]: option }));
+  }, []);
 
-  useEffect(() => {
-    const fetchLessons = async () => {
-      try {
-        const res = await api.get('/academy');
-        setLessons(res.data.lessons);
-      } catch (error) {
-        console.error('Failed to fetch academy data:', error);
-      } finally {
-        setLoading(false);
+  const handleSubmit = useCallback(async () => {
+    let correctCount = 0;
+    QUIZ_QUESTIONS.forEach((q, index) => {
+      if (answers[index] === q.correct) {
+        correctCount++;
       }
-    };
-    fetchLessons();
-  }, [api]);
-
-  const categories = ['Cleansing', 'Anti-aging', 'Acne-care', 'Diet', 'Mental Health'];
-
-  const filteredLessons = useMemo(() => {
-    return lessons.filter(lesson => lesson.category === activeTab);
-  }, [lessons, activeTab]);
-
-  const handleQuizSubmit = async (lessonId, score) => {
+    });
+    setSubmitting(true);
     try {
-      setLoading(true);
-      await api.post('/academy/quiz', { lessonId, score });
-      setQuizScore({ lessonId, score });
-      alert(`Quiz submitted! Your score: ${score}/5`);
-    } catch (error) {
-      console.error('Quiz submission failed:', error);
+      await onSubmit(lesson.id, correctCount);
     } finally {
-      setLoading(false);
+      setSubmitting(false);
     }
-  };
-
-  const QuizComponent = ({ lesson }) => {
-    const [answers, setAnswers] = useState({});
-    const isCompleted = quizScore?.lessonId === lesson.id;
-
-    const questions = [
-      { q: 'What is the main function of a cleanser?', options: ['Hydration', 'Removal of dirt', 'UV protection'], correct: 'Removal of dirt' },
-      { q: 'Which ingredient is best for anti-aging?', options: ['Water', 'Retinol', 'Alcohol'], correct: 'Retinol' },
-      { q: 'Acne-prone skin should avoid which type of product?', options: ['Oil-free', 'Non-comedogenic', 'Heavy oils'], correct: 'Heavy oils' },
-      { q: 'How often should you apply sunscreen?', options: ['Once a day', 'Every 2 hours', 'Only when sunny'], correct: 'Every 2 hours' },
-      { q: 'What is the most important step in any routine?', options: ['Toner', 'Cleansing', 'Masking'], correct: 'Cleansing' }
-    ];
-
-    const handleSubmit = () => {
-      let correctCount = 0;
-      questions.forEach((q, index) => {
-        if (answers[index] === q.correct) {
-          correctCount++;
-        }
-      });
-      handleQuizSubmit(lesson.id, correctCount);
-    };
+  }, [answers, lesson.id, onSubmit]);
 
-    return (
-      <Card className="mt-4 p-4 border border-blue-200 dark:border-blue-800">
-        <h4 className="text-xl font-bold mb-4 text-blue-600 dark:text-blue-400">Quiz: Test Your Knowledge!</h4>
-        {isCompleted ? (
-          <p className="text-green-600 dark:text-green-400 font-semibold">Quiz Completed! Score: {quizScore.score}/5</p>
-        ) : (
-          <div className="space-y-4">
-            {questions.map((q, qIndex) => (
-              <div key={qIndex}>
-                <p className="font-medium text-gray-800 dark:text-white mb-2">{qIndex + 1}. {q.q}</p>
-                <div className="flex flex-wrap gap-3">
-                  {q.options.map(option => (
-                    <motion.button
-                      key={option}
-                      onClick={() => setAnswers(prev => ({ ...prev, [qIndex]: option }))}
-                      className={`p-2 rounded-lg text-sm transition-all ${
-                        answers[qIndex] === option
-                          ? 'bg-blue-500 text-white shadow-md'
-                          : 'bg-gray-200 dark:bg-gray-700 text-gray-800 dark:text-gray-200 hover:bg-blue-100 dark:hover:bg-blue-800'
-                      }`}
-                      whileHover={{ scale: 1.05 }}
-                    >
-                      {option}
-                    </motion.button>
-                  ))}
-                </div>
+  return (
+    <Card className="mt-4 p-4 border border-blue-200 dark:border-blue-800">
+      <h4 className="text-xl font-bold mb-4 text-blue-600 dark:text-blue-400">Quiz: Test Your Knowledge!</h4>
+      {isCompleted ? (
+        <p className="text-green-600 dark:text-green-400 font-semibold">Quiz Completed! Score: {quizScore.score}/5</p>
+      ) : (
+        <div className="space-y-4">
+          {QUIZ_QUESTIONS.map((q, qIndex) => (
+            <div key={qIndex}>
+              <p className="font-medium text-gray-800 dark:text-white mb-2">{qIndex + 1}. {q.q}</p>
+              <div className="flex flex-wrap gap-3">
+                {q.options.map(option => (
+                  <QuizOption
+                    key={option}
+                    option={option}
+                    qIndex={qIndex}
+                    selected={answers[qIndex] === option}
+                    onSelect={handleSelect}
+                  />
+                ))}
               </div>
-            ))}
-            <motion.button
-              onClick={handleSubmit}
-              className="w-full p-3 bg-green-500 text-white font-bold rounded-xl hover:bg-green-600 transition-colors mt-4"
-              whileHover={{ scale: 1.02 }}
-            >
-              Submit Quiz
-            </motion.button>
-          </div>
-        )}
-      </Card>
-    );
-  };
+            </div>
+          ))}
+          <button
+            onClick={handleSubmit}
+            disabled={submitting}
+            className="w-full p-3 bg-green-500 text-white font-bold rounded-xl hover:bg-green-600 transition mt-4 hover:scale-[1.02] flex items-center justify-center disabled:opacity-50"
+          >
+            {submitting ? <LoadingSpinner className="w-5 h-5" /> : 'Submit Quiz'}
+          </button>
+        </div>
+      )}
+    </Card>
+  );
+});
 
-  const LessonCard = ({ lesson }) => (
+const LessonCard = memo(({ lesson, quizScore, onQuizSubmit }) => {
+  // Split article text once per lesson rather than twice per render
+  const [headline, body] = useMemo(() => {
+    if (lesson.type !== 'Article') return ['', ''];
+    const lines = lesson.content.split('\n');
+    return [lines[0], lines.slice(1).join(' ')];
+  }, [lesson.content, lesson.type]);
+
+  return (
     <Card className="mb-4">
       <h3 className="text-xl font-bold mb-2 text-gray-900 dark:text-white">{lesson.title}</h3>
       <p className="text-sm text-gray-500 dark:text-gray-400 mb-4">{lesson.type}{lesson.duration}</p>
@@ -866,12 +1238,12 @@ const Academy = () => {
 
       {lesson.type === 'Article' && (
         <div className="prose dark:prose-invert max-w-none text-gray-700 dark:text-gray-300 mb-4">
-          <p className="font-medium text-lg">{lesson.content.split('\n')[0]}</p>
-          <p className="text-sm line-clamp-3">{lesson.content.split('\n').slice(1).join(' ')}</p>
+          <p className="font-medium text-lg">{headline}</p>
+          <p className="text-sm line-clamp-3">{body}</p>
         </div>
       )}
 
-      {lesson.quiz && <QuizComponent lesson={lesson} />}
+      {lesson.quiz && <QuizComponent lesson={lesson} quizScore={quizScore} onSubmit={onQuizSubmit} />}
 
       <div className="flex justify-end">
         <span className="text-sm font-semibold text-green-600 dark:text-green-400">
@@ -880,36 +1252,106 @@ const Academy = () => {
       </div>
     </Card>
   );
+}, (prev, next) => (
+  prev.lesson.id === next.lesson.id &&
+  prev.lesson.completed === next.lesson.completed &&
+  prev.quizScore === next.quizScore &&
+  prev.onQuizSubmit === next.onQuizSubmit
+));
+
+const Academy = () => {
+  const api = useApi();
+  const [lessons, setLessons] = useState([]);
+  const [loading, setLoading] = useState(true);
+  const [activeTab, setActiveTab] = useState('Cleansing');
+  const [quizScore, setQuizScore] = useState(null);
+  const [statusBanner, setStatusBanner] = useState(null);
+
+  useEffect(() => {
+    const controller = new AbortController();
+    const fetchLessons = async () => {
+      try {
+        const res = await api.get('/academy', { signal: controller.signal });
+        setLessons(res.data.lessons);
+      } catch (error) {
+        if (!axios.isCancel(error)) console.error('Failed to fetch academy data:', error);
+      } finally {
+        if (!controller.signal.aborted) setLoading(false);
+      }
+    };
+    fetchLessons();
+    return () => controller.abort();
+  }, [api]);
+
+  // Bucket lessons by category once so tab switches are a lookup
+  const lessonIndex = useMemo(() => {
+    const index = new Map();
+    for (const lesson of lessons) {
+      const bucket = index.get(lesson.category);
+      if (bucket) bucket.push(lesson);
+      else index.set(lesson.category, [lesson]);
+    }
+    return index;
+  }, [lessons]);
+
+  const filteredLessons = useMemo(() => lessonIndex.get(activeTab) ?? [], [lessonIndex, activeTab]);
+
+  // Only the submitting quiz shows a spinner; the result is an inline banner
+  const handleQuizSubmit = useCallback(async (lessonId, score) => {
+    try {
+      await api.post('/academy/quiz', { lessonId, score });
+      setQuizScore({ lessonId, score });
+      setStatusBanner({ type: 'success', message: `Quiz submitted! Your score: ${score}/5` });
+    } catch (error) {
+      console.error('Quiz submission failed:', error);
+      setStatusBanner({ type: 'error', message: 'Quiz submission failed. Please try again.' });
+    }
+  }, [api]);
+
+  useEffect(() => {
+    if (!statusBanner) return;
+    const timer = setTimeout(() => setStatusBanner(null), 2000);
+    return () => clearTimeout(timer);
+  }, [statusBanner]);
 
   return (
     <PageContainer title="Academy (Learning Hub)">
       <Card className="mb-6">
         <h2 className="text-xl font-bold mb-2 text-gray-900 dark:text-white">Your Progress: 45% Complete</h2>
         <div className="w-full bg-gray-200 rounded-full h-2.5 dark:bg-gray-700">
-          <motion.div
+          <MotionDiv
             className="bg-blue-600 h-2.5 rounded-full"
             style={{ width: '45%' }}
             initial={{ width: 0 }}
             animate={{ width: '45%' }}
             transition={{ duration: 1 }}
-          ></motion.div>
+          ></MotionDiv>
         </div>
       </Card>
 
+      {statusBanner && (
+        <MotionDiv
+          className={`mb-6 ${statusBanner.type === 'success' ? STATUS_CLASS_SUCCESS : STATUS_CLASS_ERROR}`}
+          initial={{ opacity: 0, y: -10 }}
+          animate={{ opacity: 1, y: 0 }}
+        >
+          {statusBanner.message}
+        </MotionDiv>
+      )}
+
       <div className="flex space-x-2 mb-6 overflow-x-auto pb-2">
-        {categories.map(cat => (
-          <motion.button
+        {ACADEMY_CATEGORIES.map(cat => (
+          <button
             key={cat}
-            onClick={() => setActiveTab(cat)}
-            className={`px-4 py-2 rounded-full font-semibold text-sm whitespace-nowrap transition-colors ${
+            onClick={() => setActiveTab(prev => (prev === cat ? prev : cat))}
+            className={`px-4 py-2 rounded-full font-semibold text-sm whitespace-nowrap transition hover:scale-105 ${
               activeTab === cat
                 ? 'bg-blue-600 text-white shadow-lg'
                 : 'bg-gray-200 dark:bg-gray-700 text-gray-700 dark:text-gray-300 hover:bg-blue-100 dark:hover:bg-gray-600'
             }`}
-            whileHover={{ scale: 1.05 }}
           >
             {cat}
-          </motion.button>
+          </button>
         ))}
       </div>
 
@@ -920,7 +1362,15 @@ const Academy = () => {
       ) : (
         <div className="grid grid-cols-1 md:grid-cols-2 gap-6">
           {filteredLessons.length > 0 ? (
-            filteredLessons.map(lesson => <LessonCard key={lesson.id} lesson={lesson} />)
+            filteredLessons.map(lesson => (
+              <LessonCard
+                key={lesson.id}
+                lesson={lesson}
+                // Only the card whose quiz was scored sees a new value
+                quizScore={quizScore?.lessonId === lesson.id ? quizScore : null}
+                onQuizSubmit={handleQuizSubmit}
+              />
+            ))
           ) : (
             <p className="col-span-2 text-center text-gray-500 dark:text-gray-400">No lessons available in this category.</p>
           )}
@@ -931,30 +1381,59 @@ const Academy = () => {
 };
 
 // 5. Community Forum Page
+
+// Last response per forum path. Revisits render from here instantly while a
+// background fetch revalidates (stale-while-revalidate).
+const forumCache = new Map();
+
+const ReplyRow = memo(({ reply, onUpvote }) => (
+  <div className="p-4 bg-gray-50 dark:bg-gray-700 rounded-xl flex justify-between items-start">
+    <div>
+      <p className="font-medium text-gray-800 dark:text-white">{reply.content}</p>
+      <p className="text-xs text-gray-500 dark:text-gray-400 mt-1">
+        - {reply.author} on {reply.date}
+      </p>
+    </div>
+    <MotionButton
+      onClick={() => onUpvote(reply.id)}
+      className="flex items-center text-sm text-gray-500 dark:text-gray-400 hover:text-blue-500 transition-colors"
+      whileHover={HOVER_110}
+    >
+      {reply.upvotes}
+    </MotionButton>
+  </div>
+), (prev, next) => prev.reply === next.reply && prev.onUpvote === next.onUpvote);
+
 const ForumPostDetails = ({ postId, navigate }) => {
   const api = useApi();
-  const { user } = useAuth();
-  const [post, setPost] = useState(null);
-  const [loading, setLoading] = useState(true);
+  const { user } = useAuthState();
+  const cacheKey = `/forum/post/${postId}`;
+  const [post, setPost] = useState(() => forumCache.get(cacheKey) || null);
+  const [loading, setLoading] = useState(() => !forumCache.has(cacheKey));
   const [replyText, setReplyText] = useState('');
 
   const fetchPost = useCallback(async () => {
     try {
-      setLoading(true);
-      const res = await api.get(`/forum/post/${postId}`);
+      if (!forumCache.has(cacheKey)) setLoading(true);
+      const res = await api.get(cacheKey);
       setPost(res.data.post);
     } catch (error) {
       console.error('Failed to fetch post:', error);
     } finally {
       setLoading(false);
     }
-  }, [api, postId]);
+  }, [api, cacheKey]);
 
   useEffect(() => {
     fetchPost();
   }, [fetchPost]);
 
-  const handleReply = async (e) => {
+  // Every local update, optimistic or fetched, becomes the cached copy
+  useEffect(() => {
+    if (post) forumCache.set(cacheKey, post);
+  }, [cacheKey, post]);
+
+  const handleReply = async (e) => {
     e.preventDefault();
     if (!replyText.trim()) return;
 
@@ -969,50 +1448,45 @@ const ForumPostDetails = ({ postId, navigate }) => {
     }
   };
 
-  const handleUpvote = async (replyId) => {
+  // Only the upvoted reply gets a new object, so the other rows skip re-rendering
+  const bumpUpvotes = useCallback((replyId, delta) => {
+    setPost(prev => prev && ({
+      ...prev,
+      replies: prev.replies.map(r => r.id === replyId ? { ...r, upvotes: r.upvotes + delta } : r),
+    }));
+  }, []);
+
+  const handleUpvote = useCallback(async (replyId) => {
+    bumpUpvotes(replyId, 1);
     try {
       await api.post(`/forum/upvote/${replyId}`);
-      fetchPost(); // Refresh to show updated upvotes
     } catch (error) {
       console.error('Failed to upvote:', error);
+      bumpUpvotes(replyId, -1);
     }
-  };
+  }, [api, bumpUpvotes]);
 
   if (loading) return <Skel className="h-96" />;
   if (!post) return <p className="text-red-500">Post not found.</p>;
 
   return (
     <Card className="lg:col-span-2">
-      <motion.button onClick={() => navigate('/forum')} className="text-blue-500 mb-4 flex items-center" whileHover={{ x: -5 }}>
+      <MotionButton onClick={() => navigate('/forum')} className="text-blue-500 mb-4 flex items-center" whileHover={HOVER_NUDGE_LEFT}>
         &larr; Back to Forum
-      </motion.button>
+      </MotionButton>
       <h1 className="text-3xl font-bold mb-3 text-gray-900 dark:text-white">{post.title}</h1>
       <p className="text-sm text-gray-500 dark:text-gray-400 mb-6">
         Posted by {post.author} on {post.date} in <span className="font-semibold text-blue-500">{post.category}</span>
       </p>
-      <div className="prose dark:prose-invert max-w-none mb-8 border-b pb-4">
-        {post.content.split('\n').map((line, i) => <p key={i}>{line}</p>)}
+      <div className="prose dark:prose-invert max-w-none mb-8 border-b pb-4 whitespace-pre-line">
+        {post.content}
       </div>
 
       <h2 className="text-2xl font-bold mb-4 text-gray-900 dark:text-white">{post.replies.length} Replies</h2>
 
       <div className="space-y-4 mb-8">
         {post.replies.map(reply => (
-          <div key={reply.id} className="p-4 bg-gray-50 dark:bg-gray-700 rounded-xl flex justify-between items-start">
-            <div>
-              <p className="font-medium text-gray-800 dark:text-white">{reply.content}</p>
-              <p className="text-xs text-gray-500 dark:text-gray-400 mt-1">
-                - {reply.author} on {reply.date}
-              </p>
-            </div>
-            <motion.button
-              onClick={() => handleUpvote(reply.id)}
-              className="flex items-center text-sm text-gray-500 dark:text-gray-400 hover:text-blue-500 transition-colors"
-              whileHover={{ scale: 1.1 }}
-            >
-              {reply.upvotes}
-            </motion.button>
-          </div>
+          <ReplyRow key={reply.id} reply={reply} onUpvote={handleUpvote} />
         ))}
       </div>
 
@@ -1026,34 +1500,166 @@ const ForumPostDetails = ({ postId, navigate }) => {
             className="w-full p-3 border border-gray-300 dark:border-gray-700 rounded-lg dark:bg-gray-700 dark:text-white focus:ring-green-500 focus:border-green-500 min-h-[100px]"
             required
           />
-          <motion.button
+          <MotionButton
             type="submit"
             className="mt-3 p-3 bg-green-500 text-white rounded-xl font-bold hover:bg-green-600 transition-colors"
-            whileHover={{ scale: 1.02 }}
+            whileHover={HOVER_102}
           >
             Submit Reply
-          </motion.button>
+          </MotionButton>
         </form>
       </Card>
     </Card>
   );
 };
 
+// Derived fields are computed once per fetched post, not per render or keystroke
+const decoratePost = (post) => ({
+  ...post,
+  titleLower: post.title.toLowerCase(),
+  snippet: post.content.length > 100 ? `${post.content.slice(0, 100)}...` : post.content,
+});
+
+const PostListItem = memo(({ post, navigate }) => (
+  <MotionDiv
+    onClick={() => navigate(`/forum/post/${post.id}`)}
+    className="p-4 bg-gray-50 dark:bg-gray-700 rounded-xl hover:bg-blue-50 dark:hover:bg-gray-600 transition-all cursor-pointer shadow-sm hover:shadow-md"
+    whileHover={HOVER_101}
+  >
+    <div className="flex justify-between items-start">
+      <h3 className="text-lg font-bold text-gray-900 dark:text-white mb-1 truncate">{post.title}</h3>
+      <span className="text-xs font-semibold text-blue-600 dark:text-blue-400 bg-blue-100 dark:bg-blue-900 px-2 py-1 rounded-full whitespace-nowrap">{post.category}</span>
+    </div>
+    <p className="text-sm text-gray-500 dark:text-gray-400 line-clamp-2">{post.snippet}</p>
+    <div className="flex justify-between items-center text-xs mt-2 text-gray-400 dark:text-gray-500">
+      <span>{post.replies} Replies{post.upvotes} Upvotes</span>
+      <span>{post.author}{post.date}</span>
+    </div>
+  </MotionDiv>
+), (prev, next) => (
+  prev.post.id === next.post.id &&
+  prev.post.replies === next.post.replies &&
+  prev.post.upvotes === next.post.upvotes &&
+  prev.navigate === next.navigate
+));
+
+const POST_ROW_HEIGHT = 136;
+const POST_VISIBLE_ROWS = 6;
+const POST_WINDOW_THRESHOLD = 50;
+const POST_PAGE_SIZE = 20;
+
+const PostListRow = ({ index, style, data }) => (
+  <div style={style} className="pb-4">
+    <PostListItem post={data.items[index]} navigate={data.navigate} />
+  </div>
+);
+
+const FORUM_CATEGORIES = ['All', 'Acne', 'Anti-aging', 'Routine', 'Products', 'Diet'];
+
+const CreatePostModal = ({ onClose, onCreated }) => {
+  const api = useApi();
+  const [title, setTitle] = useState('');
+  const [content, setContent] = useState('');
+  const [category, setCategory] = useState(FORUM_CATEGORIES[1]);
+  const [submitting, setSubmitting] = useState(false);
+
+  const handleSubmit = async (e) => {
+    e.preventDefault();
+    setSubmitting(true);
+    try {
+      await api.post('/forum', { title, content, category });
+      onCreated();
+      onClose();
+    } catch (error) {
+      console.error('Post creation failed:', error);
+    } finally {
+      setSubmitting(false);
+    }
+  };
+
+  return (
+    <div className="fixed inset-0 bg-black bg-opacity-50 z-50 flex items-center justify-center p-4">
+      <Card className="w-full max-w-lg">
+        <h2 className="text-2xl font-bold mb-4 text-gray-900 dark:text-white">Create New Post</h2>
+        <form onSubmit={handleSubmit} className="space-y-4">
+          <input
+            type="text"
+            placeholder="Post Title (e.g. My T-zone is too oily)"
+            value={title}
+            onChange={(e) => setTitle(e.target.value)}
+            className="w-full p-3 border rounded-lg dark:bg-gray-700 dark:text-white"
+            required
+          />
+          <select
+            value={category}
+            onChange={(e) => setCategory(e.target.value)}
+            className="w-full p-3 border rounded-lg dark:bg-gray-700 dark:text-white"
+          >
+            {FORUM_CATEGORIES.slice(1).map(cat => <option key={cat} value={cat}>{cat}</option>)}
+          </select>
+          <textarea
+            placeholder="What's your question? Be detailed..."
+            value={content}
+            onChange={(e) => setContent(e.target.value)}
+            className="w-full p-3 border rounded-lg dark:bg-gray-700 dark:text-white min-h-[150px]"
+            required
+          />
+          <div className="flex justify-end space-x-3">
+            <MotionButton
+              type="button"
+              onClick={onClose}
+              className="p-3 bg-gray-300 text-gray-800 rounded-xl font-bold hover:bg-gray-400 transition-colors"
+              whileHover={HOVER_102}
+            >
+              Cancel
+            </MotionButton>
+            <MotionButton
+              type="submit"
+              disabled={submitting}
+              className="p-3 bg-blue-600 text-white rounded-xl font-bold hover:bg-blue-700 transition-colors flex items-center"
+              whileHover={HOVER_102}
+            >
+              {submitting ? <LoadingSpinner className="w-5 h-5 mr-2" /> : 'Publish Question'}
+            </MotionButton>
+          </div>
+        </form>
+      </Card>
+    </div>
+  );
+};
+
 const Forum = ({ currentRoute, navigate }) => {
   const api = useApi();
-  const { user } = useAuth();
-  const [posts, setPosts] = useState([]);
-  const [loading, setLoading] = useState(true);
+  const { user } = useAuthState();
+  const [posts, setPosts] = useState(() => forumCache.get('/forum')?.posts || []);
+  const [nextCursor, setNextCursor] = useState(() => forumCache.get('/forum')?.nextCursor || null);
+  const [loading, setLoading] = useState(() => !forumCache.has('/forum'));
+  const [loadingMore, setLoadingMore] = useState(false);
+  const loadingMoreRef = useRef(false);
+  const sentinelRef = useRef(null);
   const [filter, setFilter] = useState('All');
   const [searchTerm, setSearchTerm] = useState('');
+  const [debouncedSearch, setDebouncedSearch] = useState('');
 
-  const categories = ['All', 'Acne', 'Anti-aging', 'Routine', 'Products', 'Diet'];
+  // Set once loadMore has appended pages beyond the first
+  const hasExtraPagesRef = useRef(false);
 
+  // First page only; further pages are pulled in by loadMore as the user scrolls.
+  // Once extra pages are loaded, a refetch refreshes the head of the list and
+  // keeps the rest (and its cursor) instead of collapsing back to page 1.
   const fetchPosts = useCallback(async () => {
     try {
-      setLoading(true);
-      const res = await api.get('/forum');
-      setPosts(res.data.posts);
+      if (!forumCache.has('/forum')) setLoading(true);
+      const res = await api.get(`/forum?limit=${POST_PAGE_SIZE}`);
+      const page = { posts: res.data.posts.map(decoratePost), nextCursor: res.data.nextCursor };
+      forumCache.set('/forum', page);
+      if (hasExtraPagesRef.current) {
+        const headIds = new Set(page.posts.map(post => post.id));
+        setPosts(prev => [...page.posts, ...prev.filter(post => !headIds.has(post.id))]);
+      } else {
+        setPosts(page.posts);
+        setNextCursor(page.nextCursor);
+      }
     } catch (error) {
       console.error('Failed to fetch forum data:', error);
     } finally {
@@ -1061,111 +1667,74 @@ const Forum = ({ currentRoute, navigate }) => {
     }
   }, [api]);
 
+  const loadMore = useCallback(async () => {
+    if (!nextCursor || loadingMoreRef.current) return;
+    loadingMoreRef.current = true;
+    setLoadingMore(true);
+    try {
+      const res = await api.get(`/forum?cursor=${encodeURIComponent(nextCursor)}&limit=${POST_PAGE_SIZE}`);
+      hasExtraPagesRef.current = true;
+      setPosts(prev => [...prev, ...res.data.posts.map(decoratePost)]);
+      setNextCursor(res.data.nextCursor);
+    } catch (error) {
+      console.error('Failed to load more posts:', error);
+    } finally {
+      loadingMoreRef.current = false;
+      setLoadingMore(false);
+    }
+  }, [api, nextCursor]);
+
+  // Runs on mount and on each return from a post; fetchPosts revalidates in
+  // place, so pages loaded by scrolling survive the round-trip
+  const isListView = !currentRoute.params;
   useEffect(() => {
-    if (!currentRoute.params) {
+    if (isListView) {
       fetchPosts();
     }
-  }, [fetchPosts, currentRoute.params]);
+  }, [fetchPosts, isListView]);
+
+  // Filter once per burst of typing rather than on every keystroke
+  useEffect(() => {
+    const timer = setTimeout(() => setDebouncedSearch(searchTerm), 150);
+    return () => clearTimeout(timer);
+  }, [searchTerm]);
+
+  // Bucket posts by category so a category filter only scans its own posts
+  const postsByCategory = useMemo(() => {
+    const buckets = new Map();
+    for (const post of posts) {
+      const bucket = buckets.get(post.category);
+      if (bucket) bucket.push(post);
+      else buckets.set(post.category, [post]);
+    }
+    return buckets;
+  }, [posts]);
 
   const filteredPosts = useMemo(() => {
-    return posts.filter(post => {
-      const categoryMatch = filter === 'All' || post.category === filter;
-      const searchMatch = post.title.toLowerCase().includes(searchTerm.toLowerCase());
-      return categoryMatch && searchMatch;
-    });
-  }, [posts, filter, searchTerm]);
+    const base = filter === 'All' ? posts : (postsByCategory.get(filter) || []);
+    const query = debouncedSearch.toLowerCase();
+    return query ? base.filter(post => post.titleLower.includes(query)) : base;
+  }, [posts, postsByCategory, filter, debouncedSearch]);
 
-  const PostListItem = ({ post }) => (
-    <motion.div
-      onClick={() => navigate(`/forum/post/${post.id}`)}
-      className="p-4 bg-gray-50 dark:bg-gray-700 rounded-xl hover:bg-blue-50 dark:hover:bg-gray-600 transition-all cursor-pointer shadow-sm hover:shadow-md"
-      whileHover={{ scale: 1.01 }}
-    >
-      <div className="flex justify-between items-start">
-        <h3 className="text-lg font-bold text-gray-900 dark:text-white mb-1 truncate">{post.title}</h3>
-        <span className="text-xs font-semibold text-blue-600 dark:text-blue-400 bg-blue-100 dark:bg-blue-900 px-2 py-1 rounded-full whitespace-nowrap">{post.category}</span>
-      </div>
-      <p className="text-sm text-gray-500 dark:text-gray-400 line-clamp-2">{post.content.substring(0, 100)}...</p>
-      <div className="flex justify-between items-center text-xs mt-2 text-gray-400 dark:text-gray-500">
-        <span>{post.replies} Replies{post.upvotes} Upvotes</span>
-        <span>{post.author}{post.date}</span>
-      </div>
-    </motion.div>
-  );
+  const postListData = useMemo(() => ({ items: filteredPosts, navigate }), [filteredPosts, navigate]);
 
-  const CreatePostModal = ({ onClose }) => {
-    const [title, setTitle] = useState('');
-    const [content, setContent] = useState('');
-    const [category, setCategory] = useState(categories[1]);
-    const [submitting, setSubmitting] = useState(false);
+  const isPostView = currentRoute.params?.id;
 
-    const handleSubmit = async (e) => {
-      e.preventDefault();
-      setSubmitting(true);
-      try {
-        await api.post('/forum', { title, content, category });
-        fetchPosts();
-        onClose();
-      } catch (error) {
-        console.error('Post creation failed:', error);
-      } finally {
-        setSubmitting(false);
-      }
-    };
+  // The windowed list pages itself via onItemsRendered; short lists use a sentinel.
+  // The sentinel only exists in the list view, and Forum stays mounted on a post.
+  const showSentinel = !isPostView && !loading && Boolean(nextCursor) && filteredPosts.length <= POST_WINDOW_THRESHOLD;
 
-    return (
-      <div className="fixed inset-0 bg-black bg-opacity-50 z-50 flex items-center justify-center p-4">
-        <Card className="w-full max-w-lg">
-          <h2 className="text-2xl font-bold mb-4 text-gray-900 dark:text-white">Create New Post</h2>
-          <form onSubmit={handleSubmit} className="space-y-4">
-            <input
-              type="text"
-              placeholder="Post Title (e.g. My T-zone is too oily)"
-              value={title}
-              onChange={(e) => setTitle(e.target.value)}
-              className="w-full p-3 border rounded-lg dark:bg-gray-700 dark:text-white"
-              required
-            />
-            <select
-              value={category}
-              onChange={(e) => setCategory(e.target.value)}
-              className="w-full p-3 border rounded-lg dark:bg-gray-700 dark:text-white"
-            >
-              {categories.slice(1).map(cat => <option key={cat} value={cat}>{cat}</option>)}
-            </select>
-            <textarea
-              placeholder="What's your question? Be detailed..."
-              value={content}
-              onChange={(e) => setContent(e.target.value)}
-              className="w-full p-3 border rounded-lg dark:bg-gray-700 dark:text-white min-h-[150px]"
-              required
-            />
-            <div className="flex justify-end space-x-3">
-              <motion.button
-                type="button"
-                onClick={onClose}
-                className="p-3 bg-gray-300 text-gray-800 rounded-xl font-bold hover:bg-gray-400 transition-colors"
-                whileHover={{ scale: 1.02 }}
-              >
-                Cancel
-              </motion.button>
-              <motion.button
-                type="submit"
-                disabled={submitting}
-                className="p-3 bg-blue-600 text-white rounded-xl font-bold hover:bg-blue-700 transition-colors flex items-center"
-                whileHover={{ scale: 1.02 }}
-              >
-                {submitting ? <LoadingSpinner className="w-5 h-5 mr-2" /> : 'Publish Question'}
-              </motion.button>
-            </div>
-          </form>
-        </Card>
-      </div>
-    );
-  };
+  useEffect(() => {
+    if (!showSentinel || !sentinelRef.current) return;
+    const observer = new IntersectionObserver(([entry]) => {
+      if (entry.isIntersecting) loadMore();
+    });
+    observer.observe(sentinelRef.current);
+    return () => observer.disconnect();
+  }, [showSentinel, loadMore]);
 
-  const isPostView = currentRoute.params?.id;
   const [isModalOpen, setIsModalOpen] = useState(false);
+  const closeModal = useCallback(() => setIsModalOpen(false), []);
 
   return (
     <PageContainer title="Community Forum">
@@ -1173,24 +1742,24 @@ const Forum = ({ currentRoute, navigate }) => {
         <ForumPostDetails postId={currentRoute.params.id} navigate={navigate} />
       ) : (
         <>
-          {isModalOpen && <CreatePostModal onClose={() => setIsModalOpen(false)} />}
+          {isModalOpen && <CreatePostModal onClose={closeModal} onCreated={fetchPosts} />}
           <div className="grid grid-cols-1 lg:grid-cols-3 gap-6 mb-6">
             <Card className="lg:col-span-1 p-4">
               <h2 className="text-xl font-bold mb-3 text-gray-900 dark:text-white">Post Filters</h2>
               <div className="flex flex-wrap gap-2">
-                {categories.map(cat => (
-                  <motion.button
+                {FORUM_CATEGORIES.map(cat => (
+                  <MotionButton
                     key={cat}
-                    onClick={() => setFilter(cat)}
+                    onClick={() => setFilter(prev => (prev === cat ? prev : cat))}
                     className={`px-3 py-1 rounded-full text-sm transition-colors ${
                       filter === cat
                         ? 'bg-blue-500 text-white shadow-md'
                         : 'bg-gray-200 dark:bg-gray-700 text-gray-800 dark:text-gray-200 hover:bg-blue-100 dark:hover:bg-gray-600'
                     }`}
-                    whileHover={{ scale: 1.05 }}
+                    whileHover={HOVER_105}
                   >
                     {cat}
-                  </motion.button>
+                  </MotionButton>
                 ))}
               </div>
               <input
@@ -1200,13 +1769,13 @@ const Forum = ({ currentRoute, navigate }) => {
                 onChange={(e) => setSearchTerm(e.target.value)}
                 className="w-full p-3 border border-gray-300 dark:border-gray-700 rounded-lg dark:bg-gray-700 dark:text-white focus:ring-blue-500 focus:border-blue-500 mt-4"
               />
-              <motion.button
+              <MotionButton
                 onClick={() => setIsModalOpen(true)}
                 className="w-full mt-4 p-3 bg-green-500 text-white font-bold rounded-xl shadow-lg hover:bg-green-600 transition-colors"
-                whileHover={{ scale: 1.02 }}
+                whileHover={HOVER_102}
               >
                 Ask a Question 
-              </motion.button>
+              </MotionButton>
             </Card>
 
             <Card className="lg:col-span-2 space-y-4">
@@ -1216,11 +1785,27 @@ const Forum = ({ currentRoute, navigate }) => {
                 </div>
               ) : (
                 <>
-                  {filteredPosts.length > 0 ? (
-                    filteredPosts.map(post => <PostListItem key={post.id} post={post} />)
+                  {filteredPosts.length > POST_WINDOW_THRESHOLD ? (
+                    // Long threads only mount the posts in view
+                    <FixedSizeList
+                      height={POST_ROW_HEIGHT * POST_VISIBLE_ROWS}
+                      width="100%"
+                      itemCount={filteredPosts.length}
+                      itemSize={POST_ROW_HEIGHT}
+                      itemData={postListData}
+                      onItemsRendered={({ visibleStopIndex }) => {
+                        if (visibleStopIndex >= filteredPosts.length - 5) loadMore();
+                      }}
+                    >
+                      {PostListRow}
+                    </FixedSizeList>
+                  ) : filteredPosts.length > 0 ? (
+                    filteredPosts.map(post => <PostListItem key={post.id} post={post} navigate={navigate} />)
                   ) : (
                     <p className="text-center text-gray-500 dark:text-gray-400 p-8">No posts match your filters or search term.</p>
                   )}
+                  {showSentinel && <div ref={sentinelRef} className="h-1" />}
+                  {loadingMore && <Skel className="h-20" />}
                 </>
               )}
             </Card>
@@ -1234,7 +1819,7 @@ const Forum = ({ currentRoute, navigate }) => {
 // 6. Consult an Expert Page
 const Consult = () => {
   const api = useApi();
-  const { user } = useAuth();
+  const { user } = useAuthState();
   const [date, setDate] = useState('');
   const [time, setTime] = useState('');
   const [type, setType] = useState('Video Call');
@@ -1248,7 +1833,7 @@ const Consult = () => {
     try {
       setLoading(true);
       const res = await api.get('/consult');
-      setBookings(res.data.bookings.reverse());
+      setBookings(res.data.bookings);
     } catch (error) {
       console.error('Failed to fetch bookings:', error);
     } finally {
@@ -1260,6 +1845,9 @@ const Consult = () => {
     fetchBookings();
   }, [fetchBookings]);
 
+  // Newest first, without mutating the fetched array
+  const displayedBookings = useMemo(() => bookings.slice().reverse(), [bookings]);
+
   const handleBooking = async (e) => {
     e.preventDefault();
     if (!isPremium) {
@@ -1283,10 +1871,10 @@ const Consult = () => {
       <h2 className="text-2xl font-bold mb-4 text-gray-900 dark:text-white">Booking History</h2>
       {loading ? (
         <Skel className="h-40" />
-      ) : bookings.length > 0 ? (
+      ) : displayedBookings.length > 0 ? (
         <div className="space-y-3">
-          {bookings.map((booking, index) => (
-            <div key={index} className="p-4 bg-gray-50 dark:bg-gray-700 rounded-xl flex justify-between items-center">
+          {displayedBookings.map(booking => (
+            <div key={booking.id ?? `${booking.date}-${booking.time}`} className="p-4 bg-gray-50 dark:bg-gray-700 rounded-xl flex justify-between items-center">
               <div>
                 <p className="font-semibold text-gray-800 dark:text-white">{booking.date} at {booking.time}</p>
                 <p className="text-sm text-blue-500 dark:text-blue-300">{booking.type} with Dr. Mock</p>
@@ -1353,7 +1941,7 @@ const Consult = () => {
             />
             <select
               value={type}
-              onChange={(e) => setType(e.target.value)}
+              onChange={(e) => { const next = e.target.value; setType(prev => (prev === next ? prev : next)); }}
               className="w-full p-3 border rounded-lg dark:bg-gray-700 dark:text-white"
               disabled={!isPremium}
             >
@@ -1367,22 +1955,22 @@ const Consult = () => {
               className="w-full p-3 border rounded-lg dark:bg-gray-700 dark:text-white min-h-[100px]"
               disabled={!isPremium}
             />
-            <motion.button
+            <MotionButton
               type="submit"
               disabled={!isPremium || bookingStatus === 'loading'}
               className="w-full p-3 bg-blue-600 text-white rounded-xl font-bold hover:bg-blue-700 transition-colors disabled:opacity-50 flex items-center justify-center"
-              whileHover={{ scale: 1.02 }}
+              whileHover={HOVER_102}
             >
               {bookingStatus === 'loading' ? <LoadingSpinner className="w-5 h-5 mr-2" /> : 'Confirm Booking'}
-            </motion.button>
+            </MotionButton>
             {bookingStatus && bookingStatus !== 'loading' && (
-              <motion.div
+              <MotionDiv
                 className={`p-3 rounded-lg text-sm ${bookingStatus.startsWith('success') ? 'bg-green-100 text-green-700 dark:bg-green-900 dark:text-green-200' : 'bg-red-100 text-red-700 dark:bg-red-900 dark:text-red-200'}`}
                 initial={{ opacity: 0, y: -10 }}
                 animate={{ opacity: 1, y: 0 }}
               >
                 {bookingStatus.split(': ')[1]}
-              </motion.div>
+              </MotionDiv>
             )}
           </form>
         </Card>
@@ -1398,56 +1986,21 @@ const Consult = () => {
 };
 
 // 7. Subscription & Monetization Page
-const Pricing = ({ navigate }) => {
-  const { user } = useAuth();
-  const api = useApi();
-  const [coupon, setCoupon] = useState('');
-  const [couponStatus, setCouponStatus] = useState(null);
-  const [isProcessing, setIsProcessing] = useState(false);
-
-  const plans = [
-    { name: 'Free', price: '0', period: 'Forever', features: ['Limited Analysis', 'Basic Academy Access', 'View Forum'], isCurrent: user?.subscription === 'Free' || !user?.subscription },
-    { name: 'Pro', price: '9.99', period: 'mo', features: ['Full Academy', 'Forum Posting & Voting', 'Comparison Analysis'], isCurrent: user?.subscription === 'Pro' },
-    { name: 'Premium', price: '29.99', period: 'mo', features: ['All Pro Features', 'Expert Consultation', 'AI Future Skin Prediction (Mock)', '24/7 Live Chat'], isCurrent: user?.subscription === 'Premium' },
-  ];
-
-  const handleApplyCoupon = async () => {
-    if (!coupon.trim()) return;
-    try {
-      const res = await api.post('/payments/coupon', { code: coupon });
-      setCouponStatus({ success: true, discount: res.data.discount });
-    } catch (error) {
-      setCouponStatus({ success: false, message: error.response?.data?.message || 'Invalid code' });
-    }
-  };
-
-  const handleMockPayment = async (planName, price) => {
-    if (planName === 'Free') return;
-
-    setIsProcessing(true);
-    // Mock Stripe Sandbox payment processing
-    try {
-      const discount = couponStatus?.success ? couponStatus.discount : 0;
-      const finalPrice = (price * (1 - discount / 100)).toFixed(2);
-      await api.post('/payments/checkout', { plan: planName, price: finalPrice, coupon: couponStatus?.success ? coupon : null });
-
-      // Update local state and refresh (in a real app, this would come from the backend)
-      alert(`Mock payment successful for ${planName} ($${finalPrice})! You are now a ${planName} user.`);
-      window.location.reload(); // Simple way to force re-auth check in mock env
-    } catch (error) {
-      alert(`Mock payment failed: ${error.response?.data?.message || 'Error processing payment.'}`);
-    } finally {
-      setIsProcessing(false);
-    }
-  };
+const PricingCard = memo(({ plan, discount, onPay, processing }) => {
+  const finalPrice = useMemo(
+    () => (parseFloat(plan.price) * (1 - discount / 100)).toFixed(2),
+    [plan.price, discount]
+  );
+  const isDiscounted = discount > 0 && plan.name !== 'Free';
 
-  const PricingCard = ({ plan }) => (
+  return (
     <Card className={`text-center p-6 flex flex-col ${plan.isCurrent ? 'ring-4 ring-blue-500' : ''}`}>
       <h3 className="text-2xl font-bold mb-2 text-gray-900 dark:text-white">{plan.name}</h3>
       <p className="text-gray-500 dark:text-gray-400 mb-6">{plan.name} plan unlocks essential features.</p>
       <div className="flex-grow">
         <p className="text-5xl font-extrabold text-blue-600 dark:text-blue-400 mb-2">
-          ${plan.price}
+          {isDiscounted && <span className="block text-lg font-medium text-gray-400 line-through">${plan.price}</span>}
+          ${isDiscounted ? finalPrice : plan.price}
           <span className="text-lg font-medium text-gray-500 dark:text-gray-400">/{plan.period}</span>
         </p>
         <ul className="text-left space-y-2 mb-8">
@@ -1459,9 +2012,9 @@ const Pricing = ({ navigate }) => {
         </ul>
       </div>
 
-      <motion.button
-        onClick={() => handleMockPayment(plan.name, parseFloat(plan.price))}
-        disabled={plan.isCurrent || plan.name === 'Free' || isProcessing}
+      <MotionButton
+        onClick={() => onPay(plan.name, finalPrice)}
+        disabled={plan.isCurrent || plan.name === 'Free' || processing}
         className={`w-full p-3 rounded-xl font-bold transition-colors ${
           plan.isCurrent
             ? 'bg-gray-400 text-white'
@@ -1469,18 +2022,87 @@ const Pricing = ({ navigate }) => {
             ? 'bg-gray-200 text-gray-700'
             : 'bg-blue-600 text-white hover:bg-blue-700'
         }`}
-        whileHover={{ scale: plan.isCurrent || plan.name === 'Free' ? 1 : 1.02 }}
-        whileTap={{ scale: plan.isCurrent || plan.name === 'Free' ? 1 : 0.98 }}
+        whileHover={plan.isCurrent || plan.name === 'Free' ? MOTION_REST : HOVER_102}
+        whileTap={plan.isCurrent || plan.name === 'Free' ? MOTION_REST : TAP_98}
       >
-        {plan.isCurrent ? 'Current Plan' : plan.name === 'Free' ? 'Current Plan' : isProcessing ? <LoadingSpinner className="w-5 h-5 mx-auto" /> : 'Get Started'}
-      </motion.button>
+        {plan.isCurrent ? 'Current Plan' : plan.name === 'Free' ? 'Current Plan' : processing ? <LoadingSpinner className="w-5 h-5 mx-auto" /> : 'Get Started'}
+      </MotionButton>
     </Card>
   );
+});
+
+const Pricing = ({ navigate }) => {
+  const { user } = useAuthState();
+  const { refreshUser } = useAuthActions();
+  const api = useApi();
+  const [coupon, setCoupon] = useState('');
+  const [couponStatus, setCouponStatus] = useState(null);
+  const [isProcessing, setIsProcessing] = useState(false);
+  const toast = useToast();
+
+  // The coupon text is read through a ref so typing doesn't change handler identity
+  const couponRef = useRef('');
+  const appliedCouponRef = useRef(null);
+  const subscription = user?.subscription;
+
+  const plans = useMemo(() => [
+    { name: 'Free', price: '0', period: 'Forever', features: ['Limited Analysis', 'Basic Academy Access', 'View Forum'], isCurrent: subscription === 'Free' || !subscription },
+    { name: 'Pro', price: '9.99', period: 'mo', features: ['Full Academy', 'Forum Posting & Voting', 'Comparison Analysis'], isCurrent: subscription === 'Pro' },
+    { name: 'Premium', price: '29.99', period: 'mo', features: ['All Pro Features', 'Expert Consultation', 'AI Future Skin Prediction (Mock)', '24/7 Live Chat'], isCurrent: subscription === 'Premium' },
+  ], [subscription]);
+
+  const discount = couponStatus?.success ? couponStatus.discount : 0;
+
+  const handleCouponChange = useCallback((e) => {
+    couponRef.current = e.target.value;
+    appliedCouponRef.current = null;
+    setCoupon(e.target.value);
+    setCouponStatus(null);
+  }, []);
+
+  const handleApplyCoupon = useCallback(async () => {
+    const code = couponRef.current;
+    if (!code.trim()) return;
+    try {
+      const res = await api.post('/payments/coupon', { code });
+      appliedCouponRef.current = code;
+      setCouponStatus({ success: true, discount: res.data.discount });
+    } catch (error) {
+      setCouponStatus({ success: false, message: error.response?.data?.message || 'Invalid code' });
+    }
+  }, [api]);
+
+  // finalPrice arrives already discounted from the card that was clicked
+  const handleMockPayment = useCallback(async (planName, finalPrice) => {
+    if (planName === 'Free') return;
+
+    setIsProcessing(true);
+    // Mock Stripe Sandbox payment processing
+    try {
+      await api.post('/payments/checkout', { plan: planName, price: finalPrice, coupon: appliedCouponRef.current });
+    } catch (error) {
+      toast.error(`Mock payment failed: ${error.response?.data?.message || 'Error processing payment.'}`);
+      setIsProcessing(false);
+      return;
+    }
+    toast.success(`Mock payment successful for ${planName} ($${finalPrice})! You are now a ${planName} user.`);
+
+    // Pull the upgraded subscription into auth state; the SPA stays warm.
+    // The payment already went through, so a failed refresh is not a payment failure.
+    try {
+      await refreshUser();
+    } catch (error) {
+      console.error('Failed to refresh subscription after checkout:', error);
+      toast.error('Payment received, but your plan could not be refreshed. Reload the page to see it.');
+    } finally {
+      setIsProcessing(false);
+    }
+  }, [api, refreshUser, toast]);
 
   return (
     <PageContainer title="Subscription Plans">
       <div className="grid grid-cols-1 md:grid-cols-3 gap-8">
-        {plans.map(plan => <PricingCard key={plan.name} plan={plan} />)}
+        {plans.map(plan => <PricingCard key={plan.name} plan={plan} discount={discount} onPay={handleMockPayment} processing={isProcessing} />)}
       </div>
 
       <Card className="mt-12 max-w-lg mx-auto">
@@ -1490,25 +2112,25 @@ const Pricing = ({ navigate }) => {
             type="text"
             placeholder="Enter Code (e.g., SKIN20)"
             value={coupon}
-            onChange={(e) => { setCoupon(e.target.value); setCouponStatus(null); }}
+            onChange={handleCouponChange}
             className="flex-grow p-3 border rounded-lg dark:bg-gray-700 dark:text-white"
           />
-          <motion.button
+          <MotionButton
             onClick={handleApplyCoupon}
             className="p-3 bg-green-500 text-white rounded-xl font-bold hover:bg-green-600 transition-colors"
-            whileHover={{ scale: 1.02 }}
+            whileHover={HOVER_102}
           >
             Apply
-          </motion.button>
+          </MotionButton>
         </div>
         {couponStatus && (
-          <motion.div
+          <MotionDiv
             className={`mt-4 p-3 rounded-lg text-sm ${couponStatus.success ? 'bg-green-100 text-green-700 dark:bg-green-900 dark:text-green-200' : 'bg-red-100 text-red-700 dark:bg-red-900 dark:text-red-200'}`}
             initial={{ opacity: 0, y: -10 }}
             animate={{ opacity: 1, y: 0 }}
           >
             {couponStatus.success ? `Success! ${couponStatus.discount}% discount applied.` : `Error: ${couponStatus.message}`}
-          </motion.div>
+          </MotionDiv>
         )}
       </Card>
     </PageContainer>
@@ -1516,46 +2138,276 @@ const Pricing = ({ navigate }) => {
 };
 
 // 8. Referral & Rewards Page
-const Referrals = () => {
-  const { user } = useAuth();
-  const api = useApi();
-  const [rewards, setRewards] = useState([]);
-  const [loading, setLoading] = useState(true);
+// Row height until the rendered cards have been measured
+const REWARD_ROW_HEIGHT = 220;
+// p-3 above and below each grid cell's card
+const REWARD_CELL_GUTTER = 24;
+const REWARD_VISIBLE_ROWS = 3;
+const REWARD_WINDOW_THRESHOLD = 30;
+const NO_REWARDS = Object.freeze([]);
+const NO_OVERFLOW_X = { overflowX: 'hidden' };
+const REDEEM_BATCH_WINDOW_MS = 250;
+const REDEEM_BATCH_MAX = 8;
+
+// Mirrors the grid's md/lg breakpoints, measured on the container
+const rewardColumnsFor = (width) => (width >= 1024 ? 3 : width >= 768 ? 2 : 1);
+
+// Width of a classic vertical scrollbar (0 with overlay scrollbars), measured once
+let scrollbarWidth = null;
+const getScrollbarWidth = () => {
+  if (scrollbarWidth === null) {
+    const probe = document.createElement('div');
+    probe.style.cssText = 'position:absolute;top:-9999px;width:100px;height:100px;overflow:scroll';
+    document.body.appendChild(probe);
+    scrollbarWidth = probe.offsetWidth - probe.clientWidth;
+    probe.remove();
+  }
+  return scrollbarWidth;
+};
 
-  const referralLink = `${window.location.origin}/signup?ref=${user?.id || 'YOURCODE'}`;
+// Reward icons as one inline sprite; each card references a symbol with <use>
+// instead of shaping a color-emoji glyph. Unknown icons fall back to the emoji.
+const REWARD_ICON_SYMBOLS = {
+  '🌟': 'reward-star',
+  '💸': 'reward-cash',
+};
+
+const RewardIconSprite = () => (
+  <svg xmlns="http://www.w3.org/2000/svg" className="hidden" aria-hidden="true">
+    <symbol id="reward-star" viewBox="0 0 24 24">
+      <path fill="#facc15" d="M12 2l2.9 6.26 6.85.74-5.1 4.64 1.42 6.76L12 17.02 5.93 20.4l1.42-6.76L2.25 9l6.85-.74L12 2z" />
+    </symbol>
+    <symbol id="reward-cash" viewBox="0 0 24 24">
+      <rect x="2" y="6" width="20" height="12" rx="2" fill="#22c55e" />
+      <circle cx="12" cy="12" r="3" fill="#dcfce7" />
+    </symbol>
+  </svg>
+);
+
+const RewardIcon = ({ icon }) => {
+  const symbolId = REWARD_ICON_SYMBOLS[icon];
+  if (!symbolId) return <span className="text-4xl block mb-3">{icon}</span>;
+  return (
+    <svg className="w-10 h-10 mb-3" aria-hidden="true">
+      <use href={`#${symbolId}`} />
+    </svg>
+  );
+};
+
+const RewardCard = memo(({ reward, points, onRedeem }) => (
+  <Card className="p-5 flex flex-col justify-between" style={OFFSCREEN_CARD_STYLE}>
+    <div>
+      <RewardIcon icon={reward.icon} />
+      <h3 className="text-xl font-bold mb-1 text-gray-900 dark:text-white">{reward.name}</h3>
+      <p className="text-sm text-gray-500 dark:text-gray-400 mb-4">{reward.description}</p>
+    </div>
+    <div className="flex justify-between items-center">
+      <span className="text-lg font-bold text-blue-600 dark:text-blue-400">{reward.points} Pts</span>
+      <MotionButton
+        onClick={() => onRedeem(reward)}
+        disabled={points < reward.points}
+        className="p-2 bg-yellow-500 text-white rounded-lg font-bold hover:bg-yellow-600 transition-colors disabled:opacity-50"
+        whileHover={HOVER_105}
+      >
+        Redeem
+      </MotionButton>
+    </div>
+  </Card>
+));
+
+const RewardGridCell = ({ columnIndex, rowIndex, style, data }) => {
+  const reward = data.items[rowIndex * data.columnCount + columnIndex];
+  const contentRef = useRef(null);
+  const { onMeasure } = data;
+
+  // Report the card's natural height so rows can grow to fit wrapped text
+  useLayoutEffect(() => {
+    if (contentRef.current) onMeasure(contentRef.current.offsetHeight);
+  }, [reward, style.width, onMeasure]);
+
+  if (!reward) return null;
+  return (
+    <div style={style} className="p-3">
+      <div ref={contentRef}>
+        <RewardCard reward={reward} points={data.points} onRedeem={data.onRedeem} />
+      </div>
+    </div>
+  );
+};
+
+const RewardsSkeleton = () => (
+  <div className="grid grid-cols-1 md:grid-cols-2 lg:grid-cols-3 gap-6">
+    {[...Array(3)].map((_, i) => <Skel key={i} className="h-40" />)}
+  </div>
+);
+
+const RewardsGrid = ({ points, onRedeem }) => {
+  const rewards = useSuspenseResource('/referrals')?.rewards ?? NO_REWARDS;
+  const gridRef = useRef(null);
+  const [gridWidth, setGridWidth] = useState(0);
+  const isWindowed = rewards.length > REWARD_WINDOW_THRESHOLD;
 
   useEffect(() => {
-    const fetchRewards = async () => {
-      try {
-        const res = await api.get('/referrals');
-        setRewards(res.data.rewards);
-      } catch (error) {
-        console.error('Failed to fetch rewards:', error);
-      } finally {
-        setLoading(false);
-      }
-    };
-    fetchRewards();
-  }, [api]);
+    if (!isWindowed || !gridRef.current) return;
+    const observer = new ResizeObserver(([entry]) => setGridWidth(entry.contentRect.width));
+    observer.observe(gridRef.current);
+    return () => observer.disconnect();
+  }, [isWindowed]);
+
+  // Tallest card seen at the current width; a resize re-measures from scratch
+  const [tallestCard, setTallestCard] = useState({ gridWidth: 0, height: 0 });
+  const measureCard = useCallback((height) => {
+    setTallestCard(prev => {
+      if (prev.gridWidth !== gridWidth) return { gridWidth, height };
+      return height > prev.height ? { gridWidth, height } : prev;
+    });
+  }, [gridWidth]);
+
+  const columnCount = rewardColumnsFor(gridWidth);
+  const rowCount = Math.ceil(rewards.length / columnCount);
+  const rowHeight = tallestCard.gridWidth === gridWidth && tallestCard.height > 0
+    ? tallestCard.height + REWARD_CELL_GUTTER
+    : REWARD_ROW_HEIGHT;
+  const gridHeight = rowHeight * REWARD_VISIBLE_ROWS;
+  // Columns share the width left beside the vertical scrollbar
+  const innerWidth = rowCount * rowHeight > gridHeight ? gridWidth - getScrollbarWidth() : gridWidth;
+  const rewardGridData = useMemo(
+    () => ({ items: rewards, columnCount, points, onRedeem, onMeasure: measureCard }),
+    [rewards, columnCount, points, onRedeem, measureCard]
+  );
 
-  const handleCopy = () => {
-    navigator.clipboard.writeText(referralLink);
-    alert('Referral link copied to clipboard!');
-  };
+  if (!isWindowed) {
+    return (
+      <div className="grid grid-cols-1 md:grid-cols-2 lg:grid-cols-3 gap-6">
+        {rewards.map(reward => (
+          <RewardCard key={reward.id} reward={reward} points={points} onRedeem={onRedeem} />
+        ))}
+      </div>
+    );
+  }
+
+  // Large catalogs only mount the cards in view
+  return (
+    <div ref={gridRef}>
+      {gridWidth > 0 && (
+        <FixedSizeGrid
+          width={gridWidth}
+          height={gridHeight}
+          columnCount={columnCount}
+          columnWidth={Math.floor(innerWidth / columnCount)}
+          rowCount={rowCount}
+          rowHeight={rowHeight}
+          itemData={rewardGridData}
+          style={NO_OVERFLOW_X}
+        >
+          {RewardGridCell}
+        </FixedSizeGrid>
+      )}
+    </div>
+  );
+};
+
+const Referrals = () => {
+  const { user } = useAuthState();
+  const { updateUser } = useAuthActions();
+  const api = useApi();
+  const toast = useToast();
+
+  const userId = user?.id;
+  const referralLink = useMemo(() => `${window.location.origin}/signup?ref=${userId || 'YOURCODE'}`, [userId]);
 
-  const handleRedeem = async (reward) => {
-    if (user.referralPoints < reward.points) return;
+  // Non-blocking: an alert() would freeze the page's animations until dismissed
+  const handleCopy = useCallback(async () => {
     try {
-      await api.post('/referrals/redeem', { rewardId: reward.id });
-      alert(`Successfully redeemed ${reward.name}! Points deducted.`);
-      window.location.reload(); // Simple mock refresh
+      await navigator.clipboard.writeText(referralLink);
+      toast.success('Referral link copied to clipboard!');
+    } catch {
+      toast.error('Copy failed. Please copy the link manually.');
+    }
+  }, [referralLink, toast]);
+
+  // Clicks within REDEEM_BATCH_WINDOW_MS of each other go out as one request
+  const pendingRedemptionsRef = useRef([]);
+  const redeemTimerRef = useRef(null);
+  // Points of batches already sent whose outcome is not yet known, and points
+  // deducted through updateUser that referralPoints has not caught up with.
+  // Both still count against the balance in handleRedeem.
+  const inFlightPointsRef = useRef(0);
+  const unrenderedSpentRef = useRef(0);
+
+  const flushRedemptions = useCallback(async () => {
+    clearTimeout(redeemTimerRef.current);
+    redeemTimerRef.current = null;
+    const batch = pendingRedemptionsRef.current;
+    pendingRedemptionsRef.current = [];
+    if (batch.length === 0) return;
+    const batchPoints = batch.reduce((sum, reward) => sum + reward.points, 0);
+    inFlightPointsRef.current += batchPoints;
+
+    const failure = (rewardId, error) => ({
+      rewardId,
+      status: error.response?.status || 500,
+      message: error.response?.data?.message || 'Error.',
+    });
+
+    let results;
+    try {
+      const res = await api.post('/referrals/redeem/batch', { rewardIds: batch.map(r => r.id) });
+      results = res.data.results;
     } catch (error) {
-      alert(`Redemption failed: ${error.response?.data?.message || 'Error.'}`);
+      if (error.response?.status !== 404) {
+        results = batch.map(r => failure(r.id, error));
+      } else {
+        // Backend without the batch route: fall back to one request per reward
+        results = await Promise.all(batch.map(reward =>
+          api.post('/referrals/redeem', { rewardId: reward.id })
+            .then(() => ({ rewardId: reward.id, status: 200 }))
+            .catch(err => failure(reward.id, err))
+        ));
+      }
     }
-  };
+
+    const redeemed = batch.filter((_, i) => results[i].status < 400);
+    const failed = results.find(r => r.status >= 400);
+    const spent = redeemed.reduce((sum, reward) => sum + reward.points, 0);
+    inFlightPointsRef.current -= batchPoints;
+    // The server has deducted the points; mirror that locally instead of reloading
+    if (spent > 0) {
+      unrenderedSpentRef.current += spent;
+      updateUser(prev => prev && ({ ...prev, referralPoints: prev.referralPoints - spent }));
+    }
+    if (redeemed.length > 0) {
+      toast.success(`Successfully redeemed ${redeemed.map(r => r.name).join(', ')}! Points deducted.`);
+    }
+    if (failed) toast.error(`Redemption failed: ${failed.message}`);
+  }, [api, updateUser, toast]);
+
+  // Redemptions still queued when the page unmounts are sent, not dropped
+  useEffect(() => flushRedemptions, [flushRedemptions]);
+
+  const referralPoints = user?.referralPoints ?? 0;
+
+  // The deducted balance has rendered, so handleRedeem sees it directly now
+  useEffect(() => {
+    unrenderedSpentRef.current = 0;
+  }, [referralPoints]);
+
+  const handleRedeem = useCallback((reward) => {
+    const pendingPoints = pendingRedemptionsRef.current.reduce((sum, r) => sum + r.points, 0);
+    const committedPoints = pendingPoints + inFlightPointsRef.current + unrenderedSpentRef.current;
+    if (referralPoints - committedPoints < reward.points) return;
+    pendingRedemptionsRef.current.push(reward);
+    if (pendingRedemptionsRef.current.length >= REDEEM_BATCH_MAX) {
+      flushRedemptions();
+      return;
+    }
+    clearTimeout(redeemTimerRef.current);
+    redeemTimerRef.current = setTimeout(flushRedemptions, REDEEM_BATCH_WINDOW_MS);
+  }, [referralPoints, flushRedemptions]);
 
   return (
     <PageContainer title="Referral & Rewards">
+      <RewardIconSprite />
       <Card className="mb-8 p-6 text-center bg-blue-50 dark:bg-blue-900/50">
         <h2 className="text-3xl font-bold text-blue-600 dark:text-blue-400 mb-2">{user?.referralPoints || 0} Points</h2>
         <p className="text-xl text-gray-700 dark:text-gray-300">Your total earned referral points.</p>
@@ -1573,177 +2425,150 @@ const Referrals = () => {
             value={referralLink}
             className="flex-grow p-3 border rounded-xl dark:bg-gray-700 dark:text-white text-sm truncate"
           />
-          <motion.button
+          <MotionButton
             onClick={handleCopy}
             className="p-3 bg-green-500 text-white rounded-xl font-bold hover:bg-green-600 transition-colors"
-            whileHover={{ scale: 1.02 }}
+            whileHover={HOVER_102}
           >
             Copy Link 
-          </motion.button>
+          </MotionButton>
         </div>
       </Card>
 
       <h2 className="text-3xl font-bold mb-6 text-gray-900 dark:text-white">Available Rewards</h2>
-      <div className="grid grid-cols-1 md:grid-cols-2 lg:grid-cols-3 gap-6">
-        {loading ? (
-          [...Array(3)].map((_, i) => <Skel key={i} className="h-40" />)
-        ) : (
-          rewards.map(reward => (
-            <Card key={reward.id} className="p-5 flex flex-col justify-between">
-              <div>
-                <span className="text-4xl block mb-3">{reward.icon}</span>
-                <h3 className="text-xl font-bold mb-1 text-gray-900 dark:text-white">{reward.name}</h3>
-                <p className="text-sm text-gray-500 dark:text-gray-400 mb-4">{reward.description}</p>
-              </div>
-              <div className="flex justify-between items-center">
-                <span className="text-lg font-bold text-blue-600 dark:text-blue-400">{reward.points} Pts</span>
-                <motion.button
-                  onClick={() => handleRedeem(reward)}
-                  disabled={user?.referralPoints < reward.points}
-                  className="p-2 bg-yellow-500 text-white rounded-lg font-bold hover:bg-yellow-600 transition-colors disabled:opacity-50"
-                  whileHover={{ scale: 1.05 }}
-                >
-                  Redeem
-                </motion.button>
-              </div>
-            </Card>
-          ))
-        )}
-      </div>
+      <Suspense fallback={<RewardsSkeleton />}>
+        <RewardsGrid points={user?.referralPoints} onRedeem={handleRedeem} />
+      </Suspense>
     </PageContainer>
   );
 };
 
 // 9. Diet & Mental Health Page
-const DietHealth = () => {
-  const api = useApi();
-  const [dietPlan, setDietPlan] = useState(null);
-  const [loading, setLoading] = useState(true);
-
-  useEffect(() => {
-    const fetchDiet = async () => {
-      try {
-        const res = await api.get('/diet');
-        setDietPlan(res.data.plan);
-      } catch (error) {
-        console.error('Failed to fetch diet plan:', error);
-      } finally {
-        setLoading(false);
-      }
-    };
-    fetchDiet();
-  }, [api]);
-
-  const HealthInput = () => {
-    const [age, setAge] = useState(30);
-    const [skinGoal, setSkinGoal] = useState('Anti-inflammatory');
-
-    return (
-      <Card className="mb-8">
-        <h2 className="text-2xl font-bold mb-4 text-gray-900 dark:text-white">Health Data Input</h2>
-        <div className="grid grid-cols-1 sm:grid-cols-2 gap-4">
-          <div className="space-y-2">
-            <label className="block text-sm font-medium text-gray-700 dark:text-gray-300">Age</label>
-            <input type="number" value={age} onChange={(e) => setAge(e.target.value)} className="w-full p-3 border rounded-lg dark:bg-gray-700 dark:text-white" />
-          </div>
-          <div className="space-y-2">
-            <label className="block text-sm font-medium text-gray-700 dark:text-gray-300">Skin Goal</label>
-            <select value={skinGoal} onChange={(e) => setSkinGoal(e.target.value)} className="w-full p-3 border rounded-lg dark:bg-gray-700 dark:text-white">
-              <option>Anti-inflammatory</option>
-              <option>Hydration Boost</option>
-              <option>Acne Reduction</option>
-              <option>Collagen Support</option>
-            </select>
-          </div>
-        </div>
-        <motion.button
-          onClick={() => alert('Mock update successful! Diet plan is generated based on these inputs.')}
-          className="mt-4 w-full p-3 bg-blue-600 text-white rounded-xl font-bold hover:bg-blue-700 transition-colors"
-          whileHover={{ scale: 1.02 }}
-        >
-          Generate Personalized Plan
-        </motion.button>
-      </Card>
-    );
+// Uncontrolled: typing doesn't re-render the card; values are read on submit
+const HealthInput = () => {
+  const toast = useToast();
+  const ageRef = useRef(null);
+  const skinGoalRef = useRef(null);
+
+  const handleGenerate = () => {
+    const age = ageRef.current.value;
+    const skinGoal = skinGoalRef.current.value;
+    toast.success(`Mock update successful! Diet plan is generated for age ${age} with a ${skinGoal} goal.`);
   };
 
-  const DietSection = () => (
-    <Card className="lg:col-span-2">
-      <h2 className="text-2xl font-bold mb-4 text-gray-900 dark:text-white">Your Skin-Boosting Diet Plan</h2>
-      {loading ? (
-        <Skel className="h-64" />
-      ) : (
-        <div className="space-y-6">
-          <p className="text-lg font-medium text-gray-800 dark:text-gray-200">
-            {dietPlan.summary}
-          </p>
-          <div className="grid grid-cols-1 md:grid-cols-3 gap-4">
-            {dietPlan.focusAreas.map((area, index) => (
-              <div key={index} className="p-4 bg-green-50 dark:bg-green-900/50 rounded-xl">
-                <h3 className="font-bold text-green-700 dark:text-green-300 mb-1">{area.title}</h3>
-                <p className="text-sm text-gray-600 dark:text-gray-300">{area.foods}</p>
-              </div>
-            ))}
-          </div>
+  return (
+    <Card className="mb-8">
+      <h2 className="text-2xl font-bold mb-4 text-gray-900 dark:text-white">Health Data Input</h2>
+      <div className="grid grid-cols-1 sm:grid-cols-2 gap-4">
+        <div className="space-y-2">
+          <label className="block text-sm font-medium text-gray-700 dark:text-gray-300">Age</label>
+          <input type="number" ref={ageRef} defaultValue={30} className="w-full p-3 border rounded-lg dark:bg-gray-700 dark:text-white" />
         </div>
-      )}
+        <div className="space-y-2">
+          <label className="block text-sm font-medium text-gray-700 dark:text-gray-300">Skin Goal</label>
+          <select ref={skinGoalRef} defaultValue="Anti-inflammatory" className="w-full p-3 border rounded-lg dark:bg-gray-700 dark:text-white">
+            <option>Anti-inflammatory</option>
+            <option>Hydration Boost</option>
+            <option>Acne Reduction</option>
+            <option>Collagen Support</option>
+          </select>
+        </div>
+      </div>
+      <MotionButton
+        onClick={handleGenerate}
+        className="mt-4 w-full p-3 bg-blue-600 text-white rounded-xl font-bold hover:bg-blue-700 transition-colors"
+        whileHover={HOVER_102}
+      >
+        Generate Personalized Plan
+      </MotionButton>
     </Card>
   );
+};
 
-  const MentalHealthSection = () => {
-    const videos = [
-      { title: '10 Min Stress Relief Meditation', url: 'https://www.youtube.com/embed/inpL2JdKj8o' },
-      { title: 'Deep Sleep Music for Stress', url: 'https://www.youtube.com/embed/5R8v-o2LhC0' },
-    ];
-    return (
-      <Card className="lg:col-span-1">
-        <h2 className="text-2xl font-bold mb-4 text-gray-900 dark:text-white">Mental Health & Stress</h2>
-        <p className="mb-4 text-gray-600 dark:text-gray-400">
-          Stress directly impacts skin health. Take a break with these embedded sessions.
-        </p>
-        <div className="space-y-4">
-          {videos.map(video => (
-            <div key={video.title} className="aspect-video bg-black rounded-lg overflow-hidden shadow-lg">
-              <iframe
-                className="w-full h-full"
-                src={video.url}
-                title={video.title}
-                frameBorder="0"
-                allowFullScreen
-              ></iframe>
-            </div>
-          ))}
-        </div>
-      </Card>
-    );
-  };
+const DietPlan = () => {
+  const dietPlan = useSuspenseResource('/diet')?.plan;
+  if (!dietPlan) return <p className="text-gray-500 dark:text-gray-400">Your diet plan couldn't be loaded. Please try again later.</p>;
 
   return (
-    <PageContainer title="Diet & Mental Health">
-      <HealthInput />
-      <div className="grid grid-cols-1 lg:grid-cols-3 gap-8">
-        <DietSection />
-        <MentalHealthSection />
+    <div className="space-y-6">
+      <p className="text-lg font-medium text-gray-800 dark:text-gray-200">
+        {dietPlan.summary}
+      </p>
+      <div className="grid grid-cols-1 md:grid-cols-3 gap-4">
+        {dietPlan.focusAreas.map((area, index) => (
+          <div key={index} className="p-4 bg-green-50 dark:bg-green-900/50 rounded-xl" style={OFFSCREEN_TILE_STYLE}>
+            <h3 className="font-bold text-green-700 dark:text-green-300 mb-1">{area.title}</h3>
+            <p className="text-sm text-gray-600 dark:text-gray-300">{area.foods}</p>
+          </div>
+        ))}
       </div>
-    </PageContainer>
+    </div>
   );
 };
 
+const DietSection = () => (
+  <Card className="lg:col-span-2">
+    <h2 className="text-2xl font-bold mb-4 text-gray-900 dark:text-white">Your Skin-Boosting Diet Plan</h2>
+    <Suspense fallback={<Skel className="h-64" />}>
+      <DietPlan />
+    </Suspense>
+  </Card>
+);
+
+const MENTAL_HEALTH_VIDEOS = Object.freeze([
+  { title: '10 Min Stress Relief Meditation', url: 'https://www.youtube.com/embed/inpL2JdKj8o' },
+  { title: 'Deep Sleep Music for Stress', url: 'https://www.youtube.com/embed/5R8v-o2LhC0' },
+]);
+
+// Static content: never re-render, so the embeds mount once per visit no matter
+// how often DietHealth or the theme changes
+const MentalHealthSection = memo(() => (
+  <Card className="lg:col-span-1">
+    <h2 className="text-2xl font-bold mb-4 text-gray-900 dark:text-white">Mental Health & Stress</h2>
+    <p className="mb-4 text-gray-600 dark:text-gray-400">
+      Stress directly impacts skin health. Take a break with these embedded sessions.
+    </p>
+    <div className="space-y-4">
+      {MENTAL_HEALTH_VIDEOS.map(video => (
+        <LazyIframe
+          key={video.title}
+          src={video.url}
+          title={video.title}
+          className="aspect-video bg-black rounded-lg overflow-hidden shadow-lg"
+        />
+      ))}
+    </div>
+  </Card>
+), () => true);
+
+const DietHealth = () => (
+  <PageContainer title="Diet & Mental Health">
+    <HealthInput />
+    <div className="grid grid-cols-1 lg:grid-cols-3 gap-8">
+      <DietSection />
+      <MentalHealthSection />
+    </div>
+  </PageContainer>
+);
+
 // 10. Settings & Profile Page
 const Settings = () => {
-  const { user } = useAuth();
+  const { user } = useAuthState();
   const { isDark, toggleTheme } = useTheme();
 
   const [voiceTip, setVoiceTip] = useState('');
   const [voiceLoading, setVoiceLoading] = useState(false);
 
-  const handleVoiceTip = async () => {
+  const handleVoiceTip = useCallback(async () => {
     setVoiceLoading(true);
     // Mock AI Voice Tip generation
     await new Promise(resolve => setTimeout(resolve, 1500));
-    setVoiceTip('Remember to double cleanse at night to fully remove sunscreen and pollution particles!');
-    setVoiceLoading(false);
-  };
+    // The tip and its entrance animation can yield to input that arrives meanwhile
+    startTransition(() => {
+      setVoiceTip('Remember to double cleanse at night to fully remove sunscreen and pollution particles!');
+      setVoiceLoading(false);
+    });
+  }, []);
 
   return (
     <PageContainer title="Settings & Profile">
@@ -1773,47 +2598,47 @@ const Settings = () => {
 
           <div className="flex justify-between items-center p-4 border-b dark:border-gray-700">
             <span className="text-lg font-medium text-gray-800 dark:text-gray-200">Dark Mode</span>
-            <motion.button
+            <MotionButton
               onClick={toggleTheme}
               className={`p-2 rounded-full w-14 h-8 flex items-center transition-colors ${isDark ? 'bg-blue-600 justify-end' : 'bg-gray-300 justify-start'}`}
-              whileTap={{ scale: 0.95 }}
+              whileTap={TAP_95}
             >
               <span className="block w-6 h-6 bg-white rounded-full shadow-md"></span>
-            </motion.button>
+            </MotionButton>
           </div>
 
           <div className="p-4 border-b dark:border-gray-700">
             <h3 className="text-lg font-medium text-gray-800 dark:text-gray-200 mb-2">Voice-based Skin Tips</h3>
             <p className="text-sm text-gray-500 dark:text-gray-400 mb-3">Record your voice to receive personalized skincare advice.</p>
-            <motion.button
+            <MotionButton
               onClick={handleVoiceTip}
               disabled={voiceLoading}
               className="p-3 bg-purple-500 text-white rounded-xl font-bold hover:bg-purple-600 transition-colors flex items-center"
-              whileHover={{ scale: 1.02 }}
+              whileHover={HOVER_102}
             >
               {voiceLoading ? <LoadingSpinner className="w-5 h-5 mr-2" /> : 'Start Recording '}
-            </motion.button>
+            </MotionButton>
             {voiceTip && (
-              <motion.p
+              <MotionP
                 className="mt-3 p-3 bg-purple-100 dark:bg-purple-900/50 rounded-lg text-purple-700 dark:text-purple-200"
                 initial={{ opacity: 0, y: 10 }}
                 animate={{ opacity: 1, y: 0 }}
               >
                 **AI Tip:** {voiceTip}
-              </motion.p>
+              </MotionP>
             )}
           </div>
 
           <div className="p-4">
             <h3 className="text-lg font-medium text-gray-800 dark:text-gray-200 mb-2">Future AR Try-On</h3>
             <p className="text-sm text-gray-500 dark:text-gray-400">A placeholder for future augmented reality product try-on features.</p>
-            <motion.button
+            <MotionButton
               disabled
               className="mt-3 p-3 bg-gray-300 text-gray-700 rounded-xl font-bold"
-              whileHover={{ scale: 1.02 }}
+              whileHover={HOVER_102}
             >
               Launch AR (Coming Soon)
-            </motion.button>
+            </MotionButton>
           </div>
         </Card>
       </div>
@@ -1824,8 +2649,27 @@ const Settings = () => {
 
 // --- Main Layout and Router ---
 
+const MOBILE_NAV_PATHS = ['/dashboard', '/analyzer', '/academy', '/forum', '/settings'];
+
+// Bottom nav for small screens; only re-renders when the path changes
+const MobileNav = memo(({ navigate, path }) => (
+  <div className="fixed bottom-0 left-0 right-0 p-3 bg-white dark:bg-gray-900 border-t border-gray-200 dark:border-gray-700 z-50 md:hidden flex justify-around">
+    {MOBILE_NAV_PATHS.map(to => (
+      <NavItem key={to} to={to} label="" navigate={navigate} isActive={path === to} />
+    ))}
+  </div>
+));
+
+const PageFallback = () => (
+  <div className="min-h-screen flex items-center justify-center">
+    <LoadingSpinner className="w-10 h-10 text-blue-500" />
+  </div>
+);
+
 const AppContent = () => {
-  const { user, loading } = useAuth();
+  const { user, loading } = useAuthState();
+  // Read before the early returns below so the hook order never changes
+  const { logout } = useAuthActions();
 
   const routes = useMemo(() => [
     { path: '/login', component: LoginSignup, protected: false },
@@ -1854,6 +2698,9 @@ const AppContent = () => {
   }
 
   const PageComponent = currentRoute?.component;
+  // The forum list and post views are one Forum instance; moving between them
+  // shouldn't remount it and drop its loaded posts
+  const animKey = path.startsWith('/forum') ? '/forum' : path;
 
   if (path === '/login' || path === '/signup' || !user) {
     return <LoginSignup navigate={navigate} />;
@@ -1861,27 +2708,23 @@ const AppContent = () => {
 
   return (
     <div className="flex min-h-screen bg-gray-50 dark:bg-gray-900 transition-colors duration-300">
-      <Sidebar navigate={navigate} path={path} user={user} logout={useAuth().logout} />
+      <Sidebar navigate={navigate} path={path} user={user} logout={logout} />
       <div className="flex-grow md:ml-64">
         <Header navigate={navigate} />
         <main>
           <AnimatePresence mode="wait">
             {PageComponent && (
-              <motion.div key={path}>
-                <PageComponent navigate={navigate} currentRoute={currentRoute} />
-              </motion.div>
+              <MotionDiv key={animKey}>
+                {/* Boundary for routes whose component is loaded on demand */}
+                <Suspense fallback={<PageFallback />}>
+                  <PageComponent navigate={navigate} currentRoute={currentRoute} />
+                </Suspense>
+              </MotionDiv>
             )}
           </AnimatePresence>
         </main>
       </div>
-      {/* Mobile Nav Overlay */}
-      <div className="fixed bottom-0 left-0 right-0 p-3 bg-white dark:bg-gray-900 border-t border-gray-200 dark:border-gray-700 z-50 md:hidden flex justify-around">
-        <NavItem to="/dashboard"  label="" navigate={navigate} currentPath={path} />
-        <NavItem to="/analyzer" label="" navigate={navigate} currentPath={path} />
-        <NavItem to="/academy"  label="" navigate={navigate} currentPath={path} />
-        <NavItem to="/forum" label="" navigate={navigate} currentPath={path} />
-        <NavItem to="/settings" label="" navigate={navigate} currentPath={path} />
-      </div>
+      <MobileNav navigate={navigate} path={path} />
     </div>
   );
 };
@@ -1891,12 +2734,11 @@ const AppContent = () => {
 
 const App = () => (
   <ThemeProvider>
-    <AuthContext.Provider value={useAuth()}>
-      {/* AuthProvider is required to provide the correct context structure */}
-      <AuthProvider>
+    <AuthProvider>
+      <ToastProvider>
         <AppContent />
-      </AuthProvider>
-    </AuthContext.Provider>
+      </ToastProvider>
+    </AuthProvider>
   </ThemeProvider>
 );
 